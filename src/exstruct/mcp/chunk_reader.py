@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from functools import lru_cache
 import json
 from pathlib import Path
 from typing import Any, cast
@@ -8,6 +9,8 @@ from pydantic import BaseModel, Field
 
 from .io import PathPolicy
 
+_JSON_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+
 
 class ReadJsonChunkFilter(BaseModel):
     """Filter options for JSON chunk extraction."""
@@ -295,11 +298,13 @@ def _col_in_range(key: str, start: int, end: int) -> bool:
     return start <= index <= end
 
 
+@lru_cache(maxsize=2048)
 def _parse_col_index(key: str) -> int | None:
     """Parse a column key into a 0-based index.
 
     Supports both legacy numeric keys ("0", "1", ...) and
     alpha keys ("A", "B", ..., "AA", ...) emitted by alpha_col mode.
+    Results are cached because the same keys repeat on every row.
 
     Args:
         key: Column key string.
@@ -378,26 +383,31 @@ def _build_sheet_chunk(
         warnings.append("Base payload exceeds max_bytes; returning without rows.")
         return base_json, None, warnings
 
+    # Rows are sized one at a time: the full payload is the base envelope with
+    # each serialized row (plus a separating comma) spliced into ``rows``.
     selected: list[dict[str, Any]] = []
+    payload_size = _json_size(base_json)
     next_cursor = None
     for offset, row in enumerate(remaining_rows):
-        selected.append(row)
-        sheet_payload["rows"] = selected
-        candidate = _serialize_json(payload)
-        if _json_size(candidate) > max_bytes:
-            if len(selected) == 1:
+        candidate_size = payload_size + _json_size(_serialize_json(row))
+        if selected:
+            candidate_size += 1
+        if candidate_size > max_bytes:
+            if not selected:
                 warnings.append("max_bytes too small; returning a single row chunk.")
+                sheet_payload["rows"] = [row]
                 next_cursor = (
                     str(start_index + 1) if (start_index + 1) < len(rows) else None
                 )
-                return candidate, next_cursor, warnings
-            selected.pop()
+                return _serialize_json(payload), next_cursor, warnings
             sheet_payload["rows"] = selected
             next_cursor_index = start_index + offset
             next_cursor = (
                 str(next_cursor_index) if next_cursor_index < len(rows) else None
             )
             return _serialize_json(payload), next_cursor, warnings
+        selected.append(row)
+        payload_size = candidate_size
 
     sheet_payload["rows"] = selected
     return _serialize_json(payload), None, warnings
@@ -435,7 +445,7 @@ def _serialize_json(payload: dict[str, Any]) -> str:
     Returns:
         Serialized JSON text.
     """
-    return json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return _JSON_ENCODER.encode(payload)
 
 
 def _json_size(payload: str) -> int:
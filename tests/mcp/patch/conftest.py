@@ -0,0 +1,106 @@
+"""Shared fixtures for the patch compatibility-shim tests."""
+
+from __future__ import annotations
+
+from io import BytesIO
+from pathlib import Path
+
+from openpyxl import Workbook
+import pytest
+
+from exstruct.cli.availability import ComAvailability
+from exstruct.mcp.patch import internal, runtime as patch_runtime
+
+
+@pytest.fixture
+def workbook_path(tmp_path: Path) -> Path:
+    """Return an empty ``book.xlsx`` placeholder under ``tmp_path``.
+
+    The service only validates the input path before dispatching to the
+    engines. Every service test either stubs the engines or is rejected
+    before dispatch, so the file is never parsed.
+    """
+    path = tmp_path / "book.xlsx"
+    path.touch()
+    return path
+
+
+@pytest.fixture(scope="session")
+def minimal_xlsx_bytes() -> bytes:
+    """Return a serialised workbook with ``Sheet1`` holding A1="old", B1=1."""
+    workbook = Workbook()
+    sheet = workbook.active
+    sheet.title = "Sheet1"
+    sheet["A1"] = "old"
+    sheet["B1"] = 1
+    buffer = BytesIO()
+    workbook.save(buffer)
+    workbook.close()
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def minimal_workbook(tmp_path: Path, minimal_xlsx_bytes: bytes) -> Path:
+    """Write the cached minimal workbook to ``tmp_path / "book.xlsx"``."""
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(minimal_xlsx_bytes)
+    return path
+
+
+_COM_AVAIL_OK = ComAvailability(available=True, reason=None)
+_COM_AVAIL_NO = ComAvailability(available=False, reason="not available")
+
+
+def _com_available() -> ComAvailability:
+    return _COM_AVAIL_OK
+
+
+def _com_unavailable() -> ComAvailability:
+    return _COM_AVAIL_NO
+
+
+@pytest.fixture
+def com_available(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report Excel COM as available to the patch runtime."""
+    monkeypatch.setattr(patch_runtime, "get_com_availability", _com_available)
+
+
+@pytest.fixture
+def com_unavailable(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Report Excel COM as unavailable to the patch runtime."""
+    monkeypatch.setattr(patch_runtime, "get_com_availability", _com_unavailable)
+
+
+@pytest.fixture(scope="session")
+def add_sheet_op() -> internal.PatchOp:
+    """Return an add_sheet op that creates ``Data``."""
+    return internal.PatchOp(op="add_sheet", sheet="Data")
+
+
+@pytest.fixture(scope="session")
+def set_value_missing_op() -> internal.PatchOp:
+    """Return a set_value op that targets a sheet absent from the workbook."""
+    return internal.PatchOp(op="set_value", sheet="Missing", cell="A1", value="x")
+
+
+@pytest.fixture(scope="session")
+def apply_table_style_op() -> internal.PatchOp:
+    """Return an apply_table_style op over ``Sheet1!A1:B3``."""
+    return internal.PatchOp(
+        op="apply_table_style",
+        sheet="Sheet1",
+        range="A1:B3",
+        style="TableStyleMedium2",
+    )
+
+
+@pytest.fixture(scope="session")
+def create_chart_line_op() -> internal.PatchOp:
+    """Return a single-range line create_chart op anchored at ``D2``."""
+    return internal.PatchOp(
+        op="create_chart",
+        sheet="Sheet1",
+        chart_type="line",
+        data_range="A1:B2",
+        anchor_cell="D2",
+    )
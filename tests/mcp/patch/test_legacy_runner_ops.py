@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
-from openpyxl import Workbook, load_workbook
+from openpyxl import load_workbook
 import pytest
 import xlwings as xw
 
@@ -12,31 +12,22 @@ from exstruct.mcp.io import PathPolicy
 from exstruct.mcp.patch import internal as legacy_runner
 from exstruct.mcp.patch.internal import MakeRequest, PatchOp, PatchRequest
 
+_COM_DISABLED = ComAvailability(available=False, reason="test")
 
-def _create_workbook(path: Path) -> None:
-    workbook = Workbook()
-    sheet = workbook.active
-    sheet.title = "Sheet1"
-    sheet["A1"] = "old"
-    sheet["B1"] = 1
-    workbook.save(path)
-    workbook.close()
+
+def _com_disabled() -> ComAvailability:
+    return _COM_DISABLED
 
 
 def _disable_com(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(
-        legacy_runner,
-        "get_com_availability",
-        lambda: ComAvailability(available=False, reason="test"),
-    )
+    monkeypatch.setattr(legacy_runner, "get_com_availability", _com_disabled)
 
 
 def test_run_patch_auto_fit_columns_openpyxl_uses_single_pass_collector(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, minimal_workbook: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+    input_path = minimal_workbook
     workbook = load_workbook(input_path)
     try:
         sheet = workbook["Sheet1"]
@@ -123,11 +114,10 @@ def test_apply_xlwings_set_font_size() -> None:
 
 
 def test_run_patch_error_includes_hint_for_known_set_fill_color_mistake(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, minimal_workbook: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
     _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+    input_path = minimal_workbook
 
     def _raise_known_error(
         sheet: edit_internal.OpenpyxlWorksheetProtocol,
@@ -1,279 +1,328 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+import re
+from types import SimpleNamespace
 from typing import Any, cast
-from unittest.mock import MagicMock
 
-from pydantic import ValidationError
+from pydantic import BaseModel, ValidationError
 import pytest
 
+from exstruct.edit import CHART_TYPE_ALIASES, CHART_TYPE_TO_COM_ID
 from exstruct.mcp.patch import internal, models
 
-PatchOpFactory = Callable[..., object]
+PatchOpFactory = type[BaseModel]
+PatchModelFactories = tuple[
+    PatchOpFactory, Callable[..., object], Callable[..., object]
+]
+
+# Resolve the (PatchOp, PatchRequest, MakeRequest) trio of each shim once at
+# import time instead of on every parametrized test invocation.
+_PATCH_BACKENDS: dict[str, PatchModelFactories] = {
+    "models": (models.PatchOp, models.PatchRequest, models.MakeRequest),
+    "internal": (internal.PatchOp, internal.PatchRequest, internal.MakeRequest),
+}
+
+
+class _FakeFont:
+    Bold: bool = False
+    Size: float = 0.0
+    Color: int = 0
+
+
+class _FakeInterior:
+    Color: int = 0
+
+
+class _FakeRangeApi:
+    Font: _FakeFont
+    Interior: _FakeInterior
+
+    def __init__(self) -> None:
+        self.Font = _FakeFont()
+        self.Interior = _FakeInterior()
+
+
+class _FakeRange:
+    value: object | None = None
+    formula: str | None = None
+    api: _FakeRangeApi
+
+    def __init__(self) -> None:
+        self.api = _FakeRangeApi()
+
+
+class _FakeSheet:
+    name = "Sheet1"
+    api = object()
+
+    def __init__(self) -> None:
+        self.ranges: dict[str, _FakeRange] = {}
+
+    def range(self, ref: str) -> _FakeRange:
+        fake_range = self.ranges.get(ref)
+        if fake_range is None:
+            fake_range = self.ranges[ref] = _FakeRange()
+        return fake_range
+
+
+class _FakeSheets:
+    def __init__(self, initial: list[_FakeSheet]) -> None:
+        self._items = initial
+
+    def __getitem__(self, index: int) -> _FakeSheet:
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def add(self, name: str, after: _FakeSheet | None = None) -> _FakeSheet:
+        del after
+        sheet = _FakeSheet()
+        sheet.name = name
+        self._items.append(sheet)
+        return sheet
+
+
+class _FakeWorkbook:
+    def __init__(self) -> None:
+        self.sheets = _FakeSheets([_FakeSheet()])
+
+
+@pytest.fixture(scope="module", params=list(_PATCH_BACKENDS))
+def patch_backend(request: pytest.FixtureRequest) -> PatchModelFactories:
+    """Return the PatchOp/PatchRequest/MakeRequest classes of each shim."""
+    return _PATCH_BACKENDS[request.param]
+
+
+@pytest.fixture
+def fake_workbook() -> _FakeWorkbook:
+    """Return a fresh fake xlwings workbook with a single ``Sheet1``."""
+    return _FakeWorkbook()
+
+
+_PATCH_OP_VALIDATION_CASES: list[tuple[dict[str, Any], str]] = [
+    (
+        {"op": "set_value", "sheet": "Sheet1", "cell": "1A", "value": "x"},
+        "Invalid cell reference",
+    ),
+    (
+        {"op": "set_dimensions", "sheet": "Sheet1"},
+        "set_dimensions requires rows and/or columns",
+    ),
+    (
+        {"op": "set_dimensions", "sheet": "Sheet1", "rows": [1]},
+        "set_dimensions requires row_height when rows is provided",
+    ),
+    (
+        {
+            "op": "set_alignment",
+            "sheet": "Sheet1",
+            "cell": "A1",
+        },
+        "set_alignment requires at least one of",
+    ),
+    (
+        {
+            "op": "set_style",
+            "sheet": "Sheet1",
+            "cell": "A1",
+            "font_size": 0,
+        },
+        "set_style font_size must be > 0",
+    ),
+    (
+        {
+            "op": "draw_grid_border",
+            "sheet": "Sheet1",
+            "base_cell": "A1",
+            "row_count": 0,
+            "col_count": 1,
+        },
+        "draw_grid_border requires row_count >= 1 and col_count >= 1",
+    ),
+    (
+        {
+            "op": "set_formula",
+            "sheet": "Sheet1",
+            "cell": "A1",
+            "formula": "SUM(1,1)",
+        },
+        "set_formula requires formula starting with '='",
+    ),
+    (
+        {
+            "op": "set_fill_color",
+            "sheet": "Sheet1",
+            "cell": "A1",
+            "fill_color": "red",
+        },
+        "Invalid fill_color format",
+    ),
+    (
+        {
+            "op": "set_font_color",
+            "sheet": "Sheet1",
+            "cell": "A1",
+            "color": "#112233",
+            "fill_color": "#FFFFFF",
+        },
+        "set_font_color does not accept fill_color",
+    ),
+    (
+        {
+            "op": "auto_fit_columns",
+            "sheet": "Sheet1",
+            "min_width": 10,
+            "max_width": 5,
+        },
+        "auto_fit_columns requires min_width <= max_width",
+    ),
+    (
+        {
+            "op": "set_dimensions",
+            "sheet": "Sheet1",
+            "columns": [0],
+            "column_width": 18,
+        },
+        "columns numeric values must be positive",
+    ),
+]
+
+
+def _validate_op(op_factory: PatchOpFactory, payload: dict[str, Any]) -> BaseModel:
+    return op_factory.model_validate(payload)
 
 
 @pytest.mark.parametrize(
-    ("op_factory", "request_factory", "make_factory"),
+    ("payload", "message"),
     [
-        (models.PatchOp, models.PatchRequest, models.MakeRequest),
-        (internal.PatchOp, internal.PatchRequest, internal.MakeRequest),
+        (payload, re.compile(re.escape(message)))
+        for payload, message in _PATCH_OP_VALIDATION_CASES
     ],
-    ids=["models", "internal"],
+    ids=[message for _, message in _PATCH_OP_VALIDATION_CASES],
 )  # type: ignore[misc]
+def test_patch_op_validation_errors(
+    patch_backend: PatchModelFactories,
+    payload: dict[str, Any],
+    message: re.Pattern[str],
+) -> None:
+    op_factory = patch_backend[0]
+    with pytest.raises(ValidationError, match=message):
+        _validate_op(op_factory, payload)
+
+
+_EMPTY_DESIGN_SNAPSHOT: dict[str, list[object]] = {
+    "borders": [],
+    "fonts": [],
+    "fills": [],
+    "alignments": [],
+    "row_dimensions": [],
+    "column_dimensions": [],
+}
+
+
 @pytest.mark.parametrize(
-    ("payload", "message"),
+    ("factory_index", "path_kw", "op_payload", "dry_run", "message"),
     [
         (
-            {"op": "set_value", "sheet": "Sheet1", "cell": "1A", "value": "x"},
-            "Invalid cell reference",
-        ),
-        (
-            {"op": "set_dimensions", "sheet": "Sheet1"},
-            "set_dimensions requires rows and/or columns",
-        ),
-        (
-            {"op": "set_dimensions", "sheet": "Sheet1", "rows": [1]},
-            "set_dimensions requires row_height when rows is provided",
-        ),
-        (
-            {
-                "op": "set_alignment",
-                "sheet": "Sheet1",
-                "cell": "A1",
-            },
-            "set_alignment requires at least one of",
-        ),
-        (
-            {
-                "op": "set_style",
-                "sheet": "Sheet1",
-                "cell": "A1",
-                "font_size": 0,
-            },
-            "set_style font_size must be > 0",
-        ),
-        (
-            {
-                "op": "draw_grid_border",
-                "sheet": "Sheet1",
-                "base_cell": "A1",
-                "row_count": 0,
-                "col_count": 1,
-            },
-            "draw_grid_border requires row_count >= 1 and col_count >= 1",
-        ),
-        (
-            {
-                "op": "set_formula",
-                "sheet": "Sheet1",
-                "cell": "A1",
-                "formula": "SUM(1,1)",
-            },
-            "set_formula requires formula starting with '='",
-        ),
-        (
-            {
-                "op": "set_fill_color",
-                "sheet": "Sheet1",
-                "cell": "A1",
-                "fill_color": "red",
-            },
-            "Invalid fill_color format",
-        ),
-        (
-            {
-                "op": "set_font_color",
-                "sheet": "Sheet1",
-                "cell": "A1",
-                "color": "#112233",
-                "fill_color": "#FFFFFF",
-            },
-            "set_font_color does not accept fill_color",
+            1,
+            "xlsx_path",
+            {"op": "add_sheet", "sheet": "Data"},
+            True,
+            "backend='com' does not support",
         ),
         (
-            {
-                "op": "auto_fit_columns",
-                "sheet": "Sheet1",
-                "min_width": 10,
-                "max_width": 5,
-            },
-            "auto_fit_columns requires min_width <= max_width",
+            2,
+            "out_path",
+            {"op": "add_sheet", "sheet": "Data"},
+            True,
+            "backend='com' does not support",
         ),
         (
+            1,
+            "xlsx_path",
             {
-                "op": "set_dimensions",
+                "op": "restore_design_snapshot",
                 "sheet": "Sheet1",
-                "columns": [0],
-                "column_width": 18,
+                "design_snapshot": _EMPTY_DESIGN_SNAPSHOT,
             },
-            "columns numeric values must be positive",
+            False,
+            "backend='com' does not support restore_design_snapshot operation",
         ),
     ],
-)  # type: ignore[misc]
-def test_patch_op_validation_errors(
-    op_factory: PatchOpFactory,
-    request_factory: Callable[..., object],
-    make_factory: Callable[..., object],
-    payload: dict[str, Any],
-    message: str,
-) -> None:
-    with pytest.raises(ValidationError, match=message):
-        op_factory(**payload)
-
-    # Keep fixtures referenced so parametrization stays aligned across modules.
-    assert request_factory is not None
-    assert make_factory is not None
-
-
-@pytest.mark.parametrize(
-    ("op_factory", "request_factory", "make_factory"),
-    [
-        (models.PatchOp, models.PatchRequest, models.MakeRequest),
-        (internal.PatchOp, internal.PatchRequest, internal.MakeRequest),
-    ],
-    ids=["models", "internal"],
-)  # type: ignore[misc]
+    ids=["patch_dry_run", "make_dry_run", "restore_design_snapshot"],
+)
 def test_backend_com_rejects_dry_run_and_restore_design_snapshot(
-    op_factory: PatchOpFactory,
-    request_factory: Callable[..., object],
-    make_factory: Callable[..., object],
+    patch_backend: PatchModelFactories,
+    factory_index: int,
+    path_kw: str,
+    op_payload: dict[str, Any],
+    dry_run: bool,
+    message: str,
 ) -> None:
-    with pytest.raises(ValidationError, match="backend='com' does not support"):
-        request_factory(
-            xlsx_path="book.xlsx",
-            ops=[op_factory(op="add_sheet", sheet="Data")],
-            dry_run=True,
-            backend="com",
+    # Each shim validates its own PatchOp class, so build the op per backend.
+    ops = [_validate_op(patch_backend[0], op_payload)]
+    with pytest.raises(ValidationError, match=re.escape(message)):
+        patch_backend[factory_index](
+            **{path_kw: "book.xlsx"}, ops=ops, dry_run=dry_run, backend="com"
         )
 
-    with pytest.raises(ValidationError, match="backend='com' does not support"):
-        make_factory(
-            out_path="book.xlsx",
-            ops=[op_factory(op="add_sheet", sheet="Data")],
-            dry_run=True,
-            backend="com",
-        )
-
-    design_snapshot: dict[str, list[object]] = {
-        "borders": [],
-        "fonts": [],
-        "fills": [],
-        "alignments": [],
-        "row_dimensions": [],
-        "column_dimensions": [],
-    }
-    with pytest.raises(
-        ValidationError,
-        match="backend='com' does not support restore_design_snapshot operation",
-    ):
-        request_factory(
-            xlsx_path="book.xlsx",
-            ops=[
-                op_factory(
-                    op="restore_design_snapshot",
-                    sheet="Sheet1",
-                    design_snapshot=design_snapshot,
-                )
-            ],
-            backend="com",
-        )
-
-
-def test_internal_xlwings_helpers_error_and_success_paths() -> None:
-    class _FakeFont:
-        Bold: bool = False
-        Size: float = 0.0
-        Color: int = 0
-
-    class _FakeInterior:
-        Color: int = 0
-
-    class _FakeRangeApi:
-        Font: _FakeFont
-        Interior: _FakeInterior
-
-        def __init__(self) -> None:
-            self.Font = _FakeFont()
-            self.Interior = _FakeInterior()
 
-    class _FakeRange:
-        value: object | None = None
-        formula: str | None = None
-        api: _FakeRangeApi
-
-        def __init__(self) -> None:
-            self.api = _FakeRangeApi()
-
-    class _FakeSheet:
-        name = "Sheet1"
-        api = object()
-
-        def __init__(self) -> None:
-            self.ranges: dict[str, _FakeRange] = {}
-
-        def range(self, ref: str) -> _FakeRange:
-            self.ranges.setdefault(ref, _FakeRange())
-            return self.ranges[ref]
-
-    class _FakeSheets:
-        def __init__(self, initial: list[_FakeSheet]) -> None:
-            self._items = initial
-
-        def __getitem__(self, index: int) -> _FakeSheet:
-            return self._items[index]
-
-        def __len__(self) -> int:
-            return len(self._items)
-
-        def add(self, name: str, after: _FakeSheet | None = None) -> _FakeSheet:
-            del after
-            sheet = _FakeSheet()
-            sheet.name = name
-            self._items.append(sheet)
-            return sheet
-
-    class _FakeWorkbook:
-        def __init__(self) -> None:
-            self.sheets = _FakeSheets([_FakeSheet()])
-
-    workbook = _FakeWorkbook()
-    known_sheet = workbook.sheets[0]
+# Read-only op inputs built once at import. model_construct skips validation
+# so the too-narrow values op, which PatchOp itself would reject, can be fed in.
+_NARROW_RANGE_VALUES_OP = internal.PatchOp.model_construct(
+    op="set_range_values",
+    sheet="Sheet1",
+    range="A1:B2",
+    values=[[1], [2]],
+)
+_BAD_TABLE_STYLE_OP = internal.PatchOp(
+    op="apply_table_style",
+    sheet="Sheet1",
+    range="A1:D10",
+    style="BadStyle",
+)
+
+
+def test_internal_xlwings_helpers_error_and_success_paths(
+    fake_workbook: _FakeWorkbook,
+    add_sheet_op: internal.PatchOp,
+    set_value_missing_op: internal.PatchOp,
+    apply_table_style_op: internal.PatchOp,
+) -> None:
+    known_sheet = fake_workbook.sheets[0]
     sheet_map = {"Sheet1": known_sheet}
+    cell = known_sheet.range("A1")
+    workbook = cast(internal.XlwingsWorkbookProtocol, fake_workbook)
+    typed_sheet_map = cast(dict[str, internal.XlwingsSheetProtocol], sheet_map)
+    typed_sheet = cast(internal.XlwingsSheetProtocol, known_sheet)
+    typed_cell = cast(internal.XlwingsRangeProtocol, cell)
 
-    add_sheet_op = internal.PatchOp(op="add_sheet", sheet="NewSheet")
     diff = internal._apply_xlwings_op(
-        cast(internal.XlwingsWorkbookProtocol, workbook),
-        cast(dict[str, internal.XlwingsSheetProtocol], sheet_map),
+        workbook,
+        typed_sheet_map,
         add_sheet_op,
         0,
         False,
     )
     assert diff.after is not None
-    assert diff.after.value == "NewSheet"
-    assert "NewSheet" in sheet_map
+    assert diff.after.value == "Data"
+    assert "Data" in sheet_map
 
-    missing_sheet_op = internal.PatchOp(
-        op="set_value", sheet="Missing", cell="A1", value="x"
-    )
     with pytest.raises(ValueError, match="Sheet not found: Missing"):
         internal._apply_xlwings_op(
-            cast(internal.XlwingsWorkbookProtocol, workbook),
-            cast(dict[str, internal.XlwingsSheetProtocol], sheet_map),
-            missing_sheet_op,
+            workbook,
+            typed_sheet_map,
+            set_value_missing_op,
             1,
             False,
         )
 
-    bad_values_op = internal.PatchOp.model_construct(
-        op="set_range_values",
-        sheet="Sheet1",
-        range="A1:B2",
-        values=[[1], [2]],
-    )
     with pytest.raises(ValueError, match="values width does not match range"):
         internal._apply_xlwings_set_range_values(
-            cast(internal.XlwingsSheetProtocol, known_sheet),
-            bad_values_op,
+            typed_sheet,
+            _NARROW_RANGE_VALUES_OP,
             index=2,
         )
 
@@ -281,26 +330,20 @@ def test_internal_xlwings_helpers_error_and_success_paths() -> None:
         ValueError, match="apply_table_style requires sheet ListObjects COM API"
     ):
         internal._apply_xlwings_apply_table_style(
-            cast(internal.XlwingsSheetProtocol, known_sheet),
-            internal.PatchOp(
-                op="apply_table_style",
-                sheet="Sheet1",
-                range="A1:B2",
-                style="TableStyleMedium2",
-            ),
+            typed_sheet,
+            apply_table_style_op,
             index=3,
         )
 
-    cell = known_sheet.range("A1")
     with pytest.raises(ValueError, match="set_value rejects values starting with '='"):
         internal._set_xlwings_cell_value(
-            cast(internal.XlwingsRangeProtocol, cell),
+            typed_cell,
             "=1+1",
             auto_formula=False,
             op_name="set_value",
         )
     converted = internal._set_xlwings_cell_value(
-        cast(internal.XlwingsRangeProtocol, cell),
+        typed_cell,
         "=1+1",
         auto_formula=True,
         op_name="set_value",
@@ -309,50 +352,102 @@ def test_internal_xlwings_helpers_error_and_success_paths() -> None:
     assert cell.formula == "=1+1"
 
 
-def test_internal_auto_fit_column_resolution_defaults() -> None:
-    class _SheetWithoutUsedRange:
-        pass
+class _SheetWithoutUsedRange:
+    pass
+
+
+class _LastCell:
+    column = 3
 
-    assert internal._resolve_auto_fit_columns_xlwings(
-        cast(internal.XlwingsSheetProtocol, _SheetWithoutUsedRange()), None
-    ) == ["A"]
 
-    class _LastCell:
-        column = 3
+class _UsedRange:
+    last_cell = _LastCell()
 
-    class _UsedRange:
-        last_cell = _LastCell()
 
-    class _SheetWithUsedRange:
-        used_range = _UsedRange()
+class _SheetWithUsedRange:
+    used_range = _UsedRange()
 
+
+def test_internal_auto_fit_column_resolution_defaults() -> None:
+    assert internal._resolve_auto_fit_columns_xlwings(
+        cast(internal.XlwingsSheetProtocol, _SheetWithoutUsedRange()), None
+    ) == ["A"]
     assert internal._resolve_auto_fit_columns_xlwings(
         cast(internal.XlwingsSheetProtocol, _SheetWithUsedRange()), None
     ) == ["A", "B", "C"]
 
 
-def test_internal_xlwings_add_list_object_retries_with_headers_keyword() -> None:
-    class _ListObjects:
-        def __init__(self) -> None:
-            self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+class _FakeTable:
+    Name = ""
+    TableStyle = ""
+
+
+_ListObjectAddImpl = Callable[[tuple[object, ...], dict[str, object]], object]
+
+
+class _FakeListObjects:
+    """Recording ListObjects collection; ``add_impl`` overrides Add's outcome."""
+
+    Count = 0
+
+    def __init__(self) -> None:
+        self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+        self.add_impl: _ListObjectAddImpl | None = None
+        self.created_table: _FakeTable | None = None
+
+    def Add(self, *args: object, **kwargs: object) -> object:  # noqa: N802
+        self.calls.append((args, kwargs))
+        if self.add_impl is not None:
+            return self.add_impl(args, kwargs)
+        table = _FakeTable()
+        self.created_table = table
+        return table
+
+
+def _range_api_with_address(address: str) -> SimpleNamespace:
+    return SimpleNamespace(Address=lambda *args: address)
+
+
+@pytest.fixture
+def fake_list_objects() -> _FakeListObjects:
+    """Return a fresh recording ListObjects collection."""
+    return _FakeListObjects()
 
-        def Add(self, *args: object, **kwargs: object) -> object:  # noqa: N802
-            self.calls.append((args, kwargs))
-            if kwargs.get("XlListObjectHasHeaders") == 1:
-                return {"status": "ok"}
-            raise RuntimeError("header mode required")
 
-    list_objects = _ListObjects()
-    source_range_api = MagicMock()
-    source_range_api.Address.return_value = "$A$1:$B$3"
+def _add_requires_headers_keyword(
+    args: tuple[object, ...], kwargs: dict[str, object]
+) -> object:
+    del args
+    if kwargs.get("XlListObjectHasHeaders") == 1:
+        return {"status": "ok"}
+    raise RuntimeError("header mode required")
+
+
+def _add_requires_address_source(
+    args: tuple[object, ...], kwargs: dict[str, object]
+) -> object:
+    source = kwargs.get("Source")
+    if source is None and len(args) >= 2:
+        source = args[1]
+    if isinstance(source, str):
+        return {"status": "address-ok"}
+    raise RuntimeError("source must be A1 string")
+
+
+def test_internal_xlwings_add_list_object_retries_with_headers_keyword(
+    fake_list_objects: _FakeListObjects,
+) -> None:
+    fake_list_objects.add_impl = _add_requires_headers_keyword
 
     created = internal._xlwings_add_list_object(
-        list_objects=list_objects,
-        source_range_api=source_range_api,
+        list_objects=fake_list_objects,
+        source_range_api=_range_api_with_address("$A$1:$B$3"),
     )
 
     assert created == {"status": "ok"}
-    assert any("XlListObjectHasHeaders" in kwargs for _, kwargs in list_objects.calls)
+    assert any(
+        "XlListObjectHasHeaders" in kwargs for _, kwargs in fake_list_objects.calls
+    )
 
 
 def test_internal_resolve_xlwings_list_objects_uses_collection_like_accessor() -> None:
@@ -390,90 +485,47 @@ def test_internal_resolve_xlwings_list_objects_rejects_non_collection_callable_r
         )
 
 
-def test_internal_apply_table_style_accepts_property_list_objects() -> None:
-    class _FakeTable:
-        Name = ""
-        TableStyle = ""
-
-    class _FakeListObjects:
-        Count = 0
-
-        def __init__(self) -> None:
-            self.add_calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
-            self.created_table: _FakeTable | None = None
-
-        def Add(self, *args: object, **kwargs: object) -> object:  # noqa: N802
-            self.add_calls.append((args, kwargs))
-            table = _FakeTable()
-            self.created_table = table
-            return table
-
-    class _FakeRangeApi:
-        @staticmethod
-        def Address(*args: object) -> str:  # noqa: ARG004
-            return "$A$1:$B$3"
-
-    class _FakeRange:
-        api = _FakeRangeApi()
-
-    class _FakeSheetApi:
-        ListObjects = _FakeListObjects()
-
-    class _FakeSheet:
-        name = "Sheet1"
-        api = _FakeSheetApi()
-
-        def range(self, ref: str) -> _FakeRange:
-            assert ref == "A1:B3"
-            return _FakeRange()
+def test_internal_apply_table_style_accepts_property_list_objects(
+    apply_table_style_op: internal.PatchOp,
+    fake_list_objects: _FakeListObjects,
+) -> None:
+    sheet = SimpleNamespace(
+        name="Sheet1",
+        api=SimpleNamespace(ListObjects=fake_list_objects),
+        range={
+            "A1:B3": SimpleNamespace(api=_range_api_with_address("$A$1:$B$3"))
+        }.__getitem__,
+    )
 
     diff = internal._apply_xlwings_apply_table_style(
-        cast(internal.XlwingsSheetProtocol, _FakeSheet()),
-        internal.PatchOp(
-            op="apply_table_style",
-            sheet="Sheet1",
-            range="A1:B3",
-            style="TableStyleMedium2",
-        ),
+        cast(internal.XlwingsSheetProtocol, sheet),
+        apply_table_style_op,
         index=0,
     )
 
     assert diff.after is not None
     assert diff.after.value == "table=Table1;table_style=TableStyleMedium2"
-    assert _FakeSheetApi.ListObjects.add_calls
-    assert _FakeSheetApi.ListObjects.created_table is not None
-    assert _FakeSheetApi.ListObjects.created_table.Name == "Table1"
-    assert _FakeSheetApi.ListObjects.created_table.TableStyle == "TableStyleMedium2"
-
-
-def test_internal_xlwings_add_list_object_falls_back_to_address_source() -> None:
-    class _ListObjects:
-        def __init__(self) -> None:
-            self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
-
-        def Add(self, *args: object, **kwargs: object) -> object:  # noqa: N802
-            self.calls.append((args, kwargs))
-            source = kwargs.get("Source")
-            if source is None and len(args) >= 2:
-                source = args[1]
-            if isinstance(source, str):
-                return {"status": "address-ok"}
-            raise RuntimeError("source must be A1 string")
-
-    list_objects = _ListObjects()
-    source_range_api = MagicMock()
-    source_range_api.Address.return_value = "$C$2:$E$9"
+    assert fake_list_objects.calls
+    assert fake_list_objects.created_table is not None
+    assert fake_list_objects.created_table.Name == "Table1"
+    assert fake_list_objects.created_table.TableStyle == "TableStyleMedium2"
+
+
+def test_internal_xlwings_add_list_object_falls_back_to_address_source(
+    fake_list_objects: _FakeListObjects,
+) -> None:
+    fake_list_objects.add_impl = _add_requires_address_source
 
     created = internal._xlwings_add_list_object(
-        list_objects=list_objects,
-        source_range_api=source_range_api,
+        list_objects=fake_list_objects,
+        source_range_api=_range_api_with_address("$C$2:$E$9"),
     )
 
     assert created == {"status": "address-ok"}
     assert any(
         isinstance(kwargs.get("Source"), str)
         or (len(args) >= 2 and isinstance(args[1], str))
-        for args, kwargs in list_objects.calls
+        for args, kwargs in fake_list_objects.calls
     )
 
 
@@ -484,43 +536,97 @@ def test_internal_normalize_table_range_address_handles_external_notation() -> N
     assert normalized == "B2:D11"
 
 
-def test_internal_create_chart_honors_titles_from_data_false() -> None:
-    series_1 = MagicMock()
-    series_1.Name = "Header-A"
-    series_2 = MagicMock()
-    series_2.Name = "Header-B"
-    series_items = {1: series_1, 2: series_2}
+def _api_with_position(left: float, top: float) -> SimpleNamespace:
+    """Return a range COM API stub exposing ``Left``/``Top`` coordinates."""
+    return SimpleNamespace(Left=left, Top=top)
 
-    class _SeriesCollection:
-        Count = 2
 
-        def Item(self, index: int) -> MagicMock:
-            return series_items[index]
+class _Recorder:
+    """Callable COM method stub that records calls and returns ``ret``."""
 
-    chart = MagicMock()
-    chart.SeriesCollection = MagicMock(return_value=_SeriesCollection())
-    chart_object = MagicMock()
-    chart_object.Chart = chart
-    chart_object.Name = "Chart 1"
+    def __init__(self, ret: object = None) -> None:
+        self.calls: list[tuple[tuple[object, ...], dict[str, object]]] = []
+        self.ret = ret
 
-    chart_collection = MagicMock()
-    chart_collection.Count = 0
-    chart_collection.Add.return_value = chart_object
-    chart_objects = MagicMock()
-    chart_objects.side_effect = lambda index=None: (
-        chart_collection if index is None else chart_object
-    )
+    def __call__(self, *args: object, **kwargs: object) -> object:
+        self.calls.append((args, kwargs))
+        return self.ret
+
+
+class _SeriesCollection:
+    """Chart ``SeriesCollection()`` stub backed by a list of series stubs."""
 
-    anchor_range = MagicMock()
-    anchor_range.api = MagicMock(Left=10.0, Top=20.0)
-    data_range = MagicMock()
-    data_range.api = "DATA_API"
-    sheet = MagicMock()
-    sheet.api = MagicMock(ChartObjects=chart_objects)
-    sheet.range.side_effect = lambda ref: {
-        "E2": anchor_range,
-        "A1:C3": data_range,
-    }[ref]
+    def __init__(self, items: list[SimpleNamespace]) -> None:
+        self._items = items
+        self.Count = len(items)
+
+    @classmethod
+    def fresh(cls, *items: SimpleNamespace) -> _SeriesCollection:
+        """Return a collection pre-populated with ``items``."""
+        return cls(list(items))
+
+    def Item(self, index: int) -> SimpleNamespace:  # noqa: N802
+        return self._items[index - 1]
+
+    def NewSeries(self) -> SimpleNamespace:  # noqa: N802
+        item = SimpleNamespace()
+        self._items.append(item)
+        self.Count = len(self._items)
+        return item
+
+
+class _ChartObjectsSideEffect:
+    """Mimic ``ChartObjects()`` / ``ChartObjects(index)`` COM dispatch."""
+
+    __slots__ = ("collection", "item")
+
+    def __init__(self, collection: object, item: object) -> None:
+        self.collection = collection
+        self.item = item
+
+    def __call__(self, index: int | None = None) -> object:
+        return self.collection if index is None else self.item
+
+
+@pytest.mark.parametrize(
+    (
+        "titles_from_data",
+        "chart_name",
+        "default_name",
+        "expected_name",
+        "expected_series_names",
+    ),
+    [
+        (False, None, "Chart 1", "Chart 1", ["Series 1", "Series 2"]),
+        (None, "Chart 1", "Existing", "Chart 1", ["Header-A", "Header-B"]),
+    ],
+    ids=["titles_from_data_false", "name_matches_new_default_name"],
+)
+def test_internal_create_chart_applies_titles_and_chart_name(
+    titles_from_data: bool | None,
+    chart_name: str | None,
+    default_name: str,
+    expected_name: str,
+    expected_series_names: list[str],
+) -> None:
+    series_1 = SimpleNamespace(Name="Header-A")
+    series_2 = SimpleNamespace(Name="Header-B")
+
+    chart = SimpleNamespace(
+        SeriesCollection=_Recorder(_SeriesCollection.fresh(series_1, series_2)),
+        SetSourceData=_Recorder(),
+    )
+    chart_object = SimpleNamespace(Chart=chart, Name=default_name)
+    chart_collection = SimpleNamespace(Count=0, Add=_Recorder(chart_object))
+
+    anchor_range = SimpleNamespace(api=_api_with_position(10.0, 20.0))
+    data_range = SimpleNamespace(api="DATA_API")
+    sheet = SimpleNamespace(
+        api=SimpleNamespace(
+            ChartObjects=_ChartObjectsSideEffect(chart_collection, chart_object)
+        ),
+        range={"E2": anchor_range, "A1:C3": data_range}.__getitem__,
+    )
 
     op = internal.PatchOp(
         op="create_chart",
@@ -528,103 +634,73 @@ def test_internal_create_chart_honors_titles_from_data_false() -> None:
         chart_type="line",
         data_range="A1:C3",
         anchor_cell="E2",
-        titles_from_data=False,
+        chart_name=chart_name,
+        titles_from_data=titles_from_data,
     )
 
     diff = internal._apply_xlwings_create_chart(
         cast(internal.XlwingsSheetProtocol, sheet), op, index=0
     )
 
-    chart.SetSourceData.assert_called_once_with("DATA_API")
-    assert series_1.Name == "Series 1"
-    assert series_2.Name == "Series 2"
+    assert chart.SetSourceData.calls == [(("DATA_API",), {})]
+    assert len(chart_collection.Add.calls) == 1
+    assert [series_1.Name, series_2.Name] == expected_series_names
+    assert chart_object.Name == expected_name
     assert diff.after is not None
     assert diff.after.kind == "chart"
 
 
-def test_internal_create_chart_allows_name_matching_new_default_name() -> None:
-    chart = MagicMock()
-    chart.SeriesCollection = MagicMock(return_value=MagicMock(Count=0))
-    chart_object = MagicMock()
-    chart_object.Chart = chart
-    chart_object.Name = "Existing"
-
-    chart_collection = MagicMock()
-    chart_collection.Count = 0
-    chart_collection.Add.return_value = chart_object
-    chart_objects = MagicMock(
-        side_effect=lambda index=None: chart_collection
-        if index is None
-        else chart_object
-    )
+class _CallFailingCollection:
+    """COM collection stub whose call path fails and ``Item`` delegates."""
 
-    anchor_range = MagicMock()
-    anchor_range.api = MagicMock(Left=15.0, Top=25.0)
-    data_range = MagicMock()
-    data_range.api = "DATA_API"
-    sheet = MagicMock()
-    sheet.api = MagicMock(ChartObjects=chart_objects)
-    sheet.range.side_effect = lambda ref: {
-        "D2": anchor_range,
-        "A1:B3": data_range,
-    }[ref]
+    def __init__(self, item_impl: Callable[[int], object]) -> None:
+        self._item_impl = item_impl
 
-    op = internal.PatchOp(
-        op="create_chart",
-        sheet="Sheet1",
-        chart_type="line",
-        data_range="A1:B3",
-        anchor_cell="D2",
-        chart_name="Chart 1",
-    )
+    def __call__(self, index: int) -> object:
+        raise TypeError("call failed")
 
-    diff = internal._apply_xlwings_create_chart(
-        cast(internal.XlwingsSheetProtocol, sheet), op, index=0
-    )
+    def Item(self, index: int) -> object:  # noqa: N802
+        return self._item_impl(index)
 
-    chart.SetSourceData.assert_called_once_with("DATA_API")
-    chart_collection.Add.assert_called_once()
-    assert diff.after is not None
-    assert diff.after.kind == "chart"
-    assert chart_object.Name == "Chart 1"
 
+def _raise_item_failed(index: int) -> object:
+    raise RuntimeError("item failed")
 
-def test_internal_get_com_collection_item_uses_item_fallback() -> None:
-    class _Collection:
-        def __call__(self, index: int) -> object:
-            raise TypeError("not callable in this dispatch mode")
 
-        def Item(self, index: int) -> str:  # noqa: N802
-            return f"item-{index}"
+def _item_label(index: int) -> object:
+    return f"item-{index}"
 
-    item = internal._get_com_collection_item(_Collection(), 2)
-    assert item == "item-2"
+
+def test_internal_get_com_collection_item_uses_item_fallback() -> None:
+    collection = _CallFailingCollection(_item_label)
+    assert internal._get_com_collection_item(collection, 2) == "item-2"
 
 
 def test_internal_get_com_collection_item_raises_on_both_paths_failure() -> None:
-    class _Collection:
-        def __call__(self, index: int) -> object:
-            raise TypeError("call failed")
+    collection = _CallFailingCollection(_raise_item_failed)
+    with pytest.raises(ValueError, match="COM collection item access failed"):
+        internal._get_com_collection_item(collection, 1)
 
-        def Item(self, index: int) -> object:  # noqa: N802
-            raise RuntimeError("item failed")
 
-    with pytest.raises(ValueError, match="COM collection item access failed"):
-        internal._get_com_collection_item(_Collection(), 1)
+_CHART_TYPE_ID_CASES: list[tuple[str, int]] = [
+    ("line", 4),
+    ("column", 51),
+    ("bar", 57),
+    ("area", 1),
+    ("pie", 5),
+    ("doughnut", -4120),
+    ("scatter", -4169),
+    ("radar", -4151),
+    ("column_clustered", 51),
+    ("bar_clustered", 57),
+    ("xy_scatter", -4169),
+    ("donut", -4120),
+]
 
 
 @pytest.mark.parametrize(
     ("chart_type", "expected_chart_type_id"),
-    [
-        ("line", 4),
-        ("column", 51),
-        ("bar", 57),
-        ("area", 1),
-        ("pie", 5),
-        ("doughnut", -4120),
-        ("scatter", -4169),
-        ("radar", -4151),
-    ],
+    _CHART_TYPE_ID_CASES,
 )  # type: ignore[misc]
 def test_internal_resolve_chart_type_id_supports_phase1_major_types(
     chart_type: str, expected_chart_type_id: int
@@ -632,96 +708,102 @@ def test_internal_resolve_chart_type_id_supports_phase1_major_types(
     assert internal._resolve_chart_type_id(chart_type) == expected_chart_type_id
 
 
-def test_internal_resolve_chart_type_id_supports_aliases() -> None:
-    assert internal._resolve_chart_type_id("column_clustered") == 51
-    assert internal._resolve_chart_type_id("bar_clustered") == 57
-    assert internal._resolve_chart_type_id("xy_scatter") == -4169
-    assert internal._resolve_chart_type_id("donut") == -4120
-
-
-def test_internal_create_chart_supports_multi_ranges_and_sheet_qualified_refs() -> None:
-    first_series = MagicMock()
-
-    class _SeriesCollection:
-        def __init__(self) -> None:
-            self._items: list[MagicMock] = [first_series]
-            self.Count = 1
-
-        def Item(self, index: int) -> MagicMock:  # noqa: N802
-            return self._items[index - 1]
-
-        def NewSeries(self) -> MagicMock:  # noqa: N802
-            item = MagicMock()
-            self._items.append(item)
-            self.Count = len(self._items)
-            return item
-
-    series_collection = _SeriesCollection()
-    chart = MagicMock()
-    chart.SeriesCollection = MagicMock(return_value=series_collection)
-    chart.ChartTitle = MagicMock()
-    axis_x = MagicMock()
-    axis_x.AxisTitle = MagicMock()
-    axis_y = MagicMock()
-    axis_y.AxisTitle = MagicMock()
-    chart.Axes = MagicMock(
-        side_effect=lambda axis_type: {1: axis_x, 2: axis_y}[axis_type]
+def test_internal_chart_type_id_cases_cover_all_mapped_types() -> None:
+    covered = {chart_type for chart_type, _ in _CHART_TYPE_ID_CASES}
+    assert set(CHART_TYPE_TO_COM_ID) <= covered
+    assert set(CHART_TYPE_ALIASES) <= covered
+
+
+@pytest.fixture
+def chart_env() -> SimpleNamespace:
+    """Return a chart sheet whose new chart sources ranges from sheet ``Data``."""
+    series_collection = _SeriesCollection.fresh(SimpleNamespace())
+    axis_x = SimpleNamespace(AxisTitle=SimpleNamespace())
+    axis_y = SimpleNamespace(AxisTitle=SimpleNamespace())
+    chart = SimpleNamespace(
+        SeriesCollection=_Recorder(series_collection),
+        SetSourceData=_Recorder(),
+        ChartTitle=SimpleNamespace(),
+        Axes={1: axis_x, 2: axis_y}.__getitem__,
+    )
+    chart_object = SimpleNamespace(Chart=chart, Name="Chart 1")
+    chart_collection = SimpleNamespace(Count=0, Add=_Recorder(chart_object))
+
+    data_sheet = SimpleNamespace(
+        name="Data",
+        range={
+            "B2:B10": SimpleNamespace(api="B_API"),
+            "C2:C10": SimpleNamespace(api="C_API"),
+            "A2:A10": SimpleNamespace(api="A_API"),
+        }.__getitem__,
     )
-    chart_object = MagicMock()
-    chart_object.Chart = chart
-    chart_object.Name = "Chart 1"
-
-    chart_collection = MagicMock()
-    chart_collection.Count = 0
-    chart_collection.Add.return_value = chart_object
-    chart_objects = MagicMock(side_effect=lambda index=None: chart_collection)
-
-    anchor_range = MagicMock()
-    anchor_range.api = MagicMock(Left=30.0, Top=40.0)
-    chart_sheet = MagicMock()
-    chart_sheet.api = MagicMock(ChartObjects=chart_objects)
-    chart_sheet.range.side_effect = lambda ref: {"E2": anchor_range}[ref]
-
-    range_b = MagicMock()
-    range_b.api = "B_API"
-    range_c = MagicMock()
-    range_c.api = "C_API"
-    range_a = MagicMock()
-    range_a.api = "A_API"
-    data_sheet = MagicMock()
-    data_sheet.name = "Data"
-    data_sheet.range.side_effect = lambda ref: {
-        "B2:B10": range_b,
-        "C2:C10": range_c,
-        "A2:A10": range_a,
-    }[ref]
-    chart_sheet.book = MagicMock(sheets={"Data": data_sheet})
+    chart_sheet = SimpleNamespace(
+        api=SimpleNamespace(
+            ChartObjects=_ChartObjectsSideEffect(chart_collection, chart_object)
+        ),
+        range={"E2": SimpleNamespace(api=_api_with_position(30.0, 40.0))}.__getitem__,
+        book=SimpleNamespace(sheets={"Data": data_sheet}),
+    )
+    return SimpleNamespace(
+        sheet=cast(internal.XlwingsSheetProtocol, chart_sheet),
+        chart=chart,
+        series_collection=series_collection,
+        axis_x=axis_x,
+        axis_y=axis_y,
+    )
+
 
+@pytest.mark.parametrize(
+    ("data_range", "category_range", "expected_values", "expected_xvalues"),
+    [
+        (
+            ["'Data'!B2:B10", "'Data'!C2:C10"],
+            "'Data'!A2:A10",
+            ["B_API", "C_API"],
+            "A_API",
+        ),
+        (
+            ["'Data'!A2:A10", "'Data'!B2:B10", "'Data'!C2:C10"],
+            None,
+            ["B_API", "C_API"],
+            "A_API",
+        ),
+        ("'Data'!B2:B10", "'Data'!A2:A10", [None], "A_API"),
+    ],
+    ids=["explicit_category", "leading_category", "single_range"],
+)
+def test_internal_create_chart_supports_multi_ranges_and_sheet_qualified_refs(
+    chart_env: SimpleNamespace,
+    data_range: str | list[str],
+    category_range: str | None,
+    expected_values: list[str | None],
+    expected_xvalues: str,
+) -> None:
     op = internal.PatchOp(
         op="create_chart",
         sheet="Chart",
         chart_type="line",
-        data_range=["'Data'!B2:B10", "'Data'!C2:C10"],
-        category_range="'Data'!A2:A10",
+        data_range=data_range,
+        category_range=category_range,
         anchor_cell="E2",
         chart_title="Revenue",
         x_axis_title="Month",
         y_axis_title="Amount",
     )
 
-    diff = internal._apply_xlwings_create_chart(
-        cast(internal.XlwingsSheetProtocol, chart_sheet), op, index=0
-    )
-
-    chart.SetSourceData.assert_called_once_with("B_API")
-    assert first_series.Values == "B_API"
-    assert first_series.XValues == "A_API"
-    second_series = series_collection.Item(2)
-    assert second_series.Values == "C_API"
-    assert second_series.XValues == "A_API"
-    assert axis_x.AxisTitle.Text == "Month"
-    assert axis_y.AxisTitle.Text == "Amount"
-    assert chart.ChartTitle.Text == "Revenue"
+    diff = internal._apply_xlwings_create_chart(chart_env.sheet, op, index=0)
+
+    series_collection = chart_env.series_collection
+    series = [
+        series_collection.Item(index) for index in range(1, series_collection.Count + 1)
+    ]
+    # Every scenario's first value range is Data!B2:B10.
+    assert chart_env.chart.SetSourceData.calls == [(("B_API",), {})]
+    assert [getattr(item, "Values", None) for item in series] == expected_values
+    assert [item.XValues for item in series] == [expected_xvalues] * len(series)
+    assert chart_env.axis_x.AxisTitle.Text == "Month"
+    assert chart_env.axis_y.AxisTitle.Text == "Amount"
+    assert chart_env.chart.ChartTitle.Text == "Revenue"
     assert diff.after is not None
     assert diff.after.kind == "chart"
 
@@ -738,16 +820,11 @@ def test_internal_normalize_chart_data_ranges_rejects_blank_entry() -> None:
         internal._normalize_chart_data_ranges(["   "])
 
 
-def test_internal_patch_op_error_adds_error_code_and_failed_field() -> None:
-    op = internal.PatchOp(
-        op="create_chart",
-        sheet="Sheet1",
-        chart_type="line",
-        data_range="A1:B2",
-        anchor_cell="D2",
-    )
+def test_internal_patch_op_error_adds_error_code_and_failed_field(
+    create_chart_line_op: internal.PatchOp,
+) -> None:
     err = internal.PatchOpError.from_op(
-        2, op, ValueError("Invalid chart range reference: bad")
+        2, create_chart_line_op, ValueError("Invalid chart range reference: bad")
     )
     assert err.detail.error_code == "invalid_range"
     assert err.detail.failed_field == "data_range"
@@ -768,21 +845,17 @@ def test_internal_classify_sheet_not_found_without_context_returns_none() -> Non
 
 
 def test_internal_patch_op_error_classifies_table_style_and_add_failures() -> None:
-    op = internal.PatchOp(
-        op="apply_table_style",
-        sheet="Sheet1",
-        range="A1:D10",
-        style="BadStyle",
-    )
     style_error = internal.PatchOpError.from_op(
-        1, op, ValueError("apply_table_style invalid table style: 'BadStyle'")
+        1,
+        _BAD_TABLE_STYLE_OP,
+        ValueError("apply_table_style invalid table style: 'BadStyle'"),
     )
     assert style_error.detail.error_code == "table_style_invalid"
     assert style_error.detail.failed_field == "style"
 
     add_error = internal.PatchOpError.from_op(
         1,
-        op,
+        _BAD_TABLE_STYLE_OP,
         ValueError(
             "apply_table_style failed to add table after COM Add signature retries."
         ),
@@ -7,6 +7,9 @@ from exstruct.mcp.patch.normalize import (
     resolve_top_level_sheet_for_payload,
 )
 
+# coerce_patch_ops returns plain dicts; assert on their keys directly rather
+# than re-validating them through PatchOp, which belongs to the model tests.
+
 
 def test_coerce_patch_ops_normalizes_aliases() -> None:
     result = coerce_patch_ops(
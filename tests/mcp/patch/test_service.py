@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+from collections.abc import Callable
 from pathlib import Path
+from typing import Literal
 
-from openpyxl import Workbook
 import pytest
 
-from exstruct.cli.availability import ComAvailability
+from exstruct.mcp import patch_runner
 from exstruct.mcp.patch import (
     internal as patch_internal,
     runtime as patch_runtime,
@@ -18,347 +19,306 @@ from exstruct.mcp.patch.engine import (
 from exstruct.mcp.patch.models import OpenpyxlEngineResult
 from exstruct.mcp.patch_runner import MakeRequest, PatchOp, PatchRequest, PatchResult
 
+ServicePatcher = Callable[..., None]
 
-def _create_workbook(path: Path) -> None:
-    """Create a minimal workbook fixture for patch tests.
+# Ops are never mutated by the service, so validated instances are shared.
+_SET_VALUE_OP = PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")
+_APPLY_TABLE_OP = PatchOp(
+    op="apply_table_style",
+    sheet="Sheet1",
+    range="A1:B3",
+    style="TableStyleMedium2",
+    table_name="SalesTable",
+)
+_BAD_TABLE_STYLE_OP = PatchOp(
+    op="apply_table_style", sheet="Sheet1", range="A1:B3", style="BadStyle"
+)
+_CREATE_CHART_OP = PatchOp(
+    op="create_chart",
+    sheet="Sheet1",
+    chart_type="line",
+    data_range="A1:B2",
+    anchor_cell="D2",
+)
+_CHART_TABLE_OP = PatchOp(
+    op="apply_table_style", sheet="Sheet1", range="A1:B2", style="TableStyleMedium2"
+)
 
-    Args:
-        path: Target workbook path.
-    """
-    workbook = Workbook()
-    sheet = workbook.active
-    assert sheet is not None
-    sheet.title = "Sheet1"
-    sheet["A1"] = "old"
-    workbook.save(path)
-    workbook.close()
 
+XlwingsEngine = Callable[[Path, Path, list[PatchOp], bool], list[object]]
+OpenpyxlEngine = Callable[[PatchRequest, Path, Path], OpenpyxlEngineResult]
 
-def test_patch_runner_run_patch_delegates_to_service(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Verify patch_runner.run_patch delegates to patch.service.run_patch.
+_DELEGATED_RESULT = PatchResult(out_path="out.xlsx", patch_diff=[], engine="openpyxl")
+_COM_RUNTIME_ERROR_DETAIL = patch_internal.PatchErrorDetail(
+    op_index=0,
+    op="set_value",
+    sheet="Sheet1",
+    cell="A1",
+    message="COM call failed.",
+    error_code="com_runtime_error",
+    raw_com_message="(-2147352567, 'Exception occurred.')",
+)
+_TABLE_STYLE_ERROR_DETAIL = patch_internal.PatchErrorDetail(
+    op_index=0,
+    op="apply_table_style",
+    sheet="Sheet1",
+    cell="A1:B3",
+    message="apply_table_style invalid table style: 'BadStyle'",
+    error_code="table_style_invalid",
+    failed_field="style",
+    raw_com_message="(-2147352567, 'Exception occurred.')",
+)
 
-    Args:
-        monkeypatch: Pytest monkeypatch fixture.
-    """
-    import exstruct.mcp.patch_runner as patch_runner
 
-    expected = PatchResult(out_path="out.xlsx", patch_diff=[], engine="openpyxl")
+def _fake_run_patch(
+    request: PatchRequest, *, policy: object | None = None
+) -> PatchResult:
+    return _DELEGATED_RESULT
 
-    def _fake_run_patch(
-        request: PatchRequest, *, policy: object | None = None
-    ) -> PatchResult:
-        return expected
-
-    monkeypatch.setattr(service, "run_patch", _fake_run_patch)
-    request = PatchRequest(
-        xlsx_path=Path("input.xlsx"),
-        ops=[PatchOp(op="add_sheet", sheet="Data")],
-    )
-    result = patch_runner.run_patch(request)
-    assert result is expected
 
+def _fake_run_make(
+    request: MakeRequest, *, policy: object | None = None
+) -> PatchResult:
+    return _DELEGATED_RESULT
 
-def test_patch_runner_run_make_delegates_to_service(
-    monkeypatch: pytest.MonkeyPatch,
-) -> None:
-    """Verify patch_runner.run_make delegates to patch.service.run_make.
-
-    Args:
-        monkeypatch: Pytest monkeypatch fixture.
-    """
-    import exstruct.mcp.patch_runner as patch_runner
 
-    expected = PatchResult(out_path="out.xlsx", patch_diff=[], engine="openpyxl")
+def _raise_com_error(
+    input_path: Path,
+    output_path: Path,
+    ops: list[PatchOp],
+    auto_formula: bool,
+) -> list[object]:
+    raise RuntimeError("boom")
 
-    def _fake_run_make(
-        request: MakeRequest, *, policy: object | None = None
-    ) -> PatchResult:
-        return expected
 
-    monkeypatch.setattr(service, "run_make", _fake_run_make)
-    request = MakeRequest(out_path=Path("output.xlsx"), ops=[])
-    result = patch_runner.run_make(request)
-    assert result is expected
+def _empty_xlwings_result(
+    input_path: Path,
+    output_path: Path,
+    ops: list[PatchOp],
+    auto_formula: bool,
+) -> list[object]:
+    return []
 
 
-def test_service_run_patch_backend_auto_prefers_com(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify backend=auto uses COM when available.
+def _reject_openpyxl_engine(
+    request: PatchRequest,
+    input_path: Path,
+    output_path: Path,
+) -> OpenpyxlEngineResult:
+    raise AssertionError("openpyxl engine should not be called")
 
-    Args:
-        tmp_path: Temporary directory fixture.
-        monkeypatch: Pytest monkeypatch fixture.
-    """
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    calls: dict[str, bool] = {}
 
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
+def _raise_patch_op_error(detail: patch_internal.PatchErrorDetail) -> XlwingsEngine:
+    """Return a COM engine fake that raises ``PatchOpError(detail)``."""
 
-    def _fake_apply_xlwings_engine(
+    def _fake(
         input_path: Path,
         output_path: Path,
         ops: list[PatchOp],
         auto_formula: bool,
     ) -> list[object]:
-        calls["com"] = True
-        return []
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _fake_apply_xlwings_engine)
-    result = service.run_patch(
-        PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
-            on_conflict="rename",
-            backend="auto",
-        )
-    )
-    assert result.error is None
-    assert result.engine == "com"
-    assert calls["com"] is True
+        raise patch_runtime.PatchOpError(detail)
 
+    return _fake
 
-def test_service_run_patch_uses_legacy_xlwings_engine_monkeypatch(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    calls: dict[str, bool] = {}
 
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
+def _recording_xlwings_engine(calls: dict[str, object]) -> XlwingsEngine:
+    """Return a COM engine fake that records the op names it receives."""
 
-    def _fake_legacy_apply_xlwings_engine(
+    def _fake(
         input_path: Path,
         output_path: Path,
         ops: list[PatchOp],
         auto_formula: bool,
     ) -> list[object]:
-        calls["legacy"] = True
+        calls["com"] = [op.op for op in ops]
         return []
 
-    monkeypatch.setattr(
-        legacy_xlwings_engine,
-        "apply_xlwings_engine",
-        _fake_legacy_apply_xlwings_engine,
-    )
+    return _fake
 
-    result = service.run_patch(
-        PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
-            on_conflict="rename",
-            backend="com",
-        )
-    )
 
-    assert result.error is None
-    assert result.engine == "com"
-    assert calls["legacy"] is True
+def _recording_openpyxl_engine(calls: dict[str, object]) -> OpenpyxlEngine:
+    """Return an openpyxl engine fake that records that it ran."""
+
+    def _fake(
+        request: PatchRequest,
+        input_path: Path,
+        output_path: Path,
+    ) -> OpenpyxlEngineResult:
+        calls["openpyxl"] = True
+        return OpenpyxlEngineResult()
 
+    return _fake
 
-def test_service_run_patch_backend_auto_fallbacks_to_openpyxl_on_com_error(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify backend=auto falls back to openpyxl when COM apply fails.
+
+@pytest.fixture
+def patch_service(monkeypatch: pytest.MonkeyPatch) -> ServicePatcher:
+    """Return a helper that replaces ``service`` attributes for one test.
 
     Args:
-        tmp_path: Temporary directory fixture.
         monkeypatch: Pytest monkeypatch fixture.
+
+    Returns:
+        Callable taking ``name=replacement`` keyword arguments.
     """
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
 
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
+    def _apply(**replacements: object) -> None:
+        for name, replacement in replacements.items():
+            monkeypatch.setattr(service, name, replacement)
+
+    return _apply
+
+
+@pytest.fixture
+def call_tracker() -> dict[str, object]:
+    """Return an empty dict that recording engine fakes write into."""
+    return {}
+
+
+def test_patch_runner_run_patch_delegates_to_service(
+    patch_service: ServicePatcher,
+) -> None:
+    """Verify patch_runner.run_patch delegates to patch.service.run_patch.
+
+    Args:
+        patch_service: Fixture replacing service attributes.
+    """
+    patch_service(run_patch=_fake_run_patch)
+    request = PatchRequest(
+        xlsx_path=Path("input.xlsx"),
+        ops=[PatchOp(op="add_sheet", sheet="Data")],
     )
+    result = patch_runner.run_patch(request)
+    assert result is _DELEGATED_RESULT
 
-    def _raise_com_error(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        raise RuntimeError("boom")
 
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        return OpenpyxlEngineResult()
+def test_patch_runner_run_make_delegates_to_service(
+    patch_service: ServicePatcher,
+) -> None:
+    """Verify patch_runner.run_make delegates to patch.service.run_make.
+
+    Args:
+        patch_service: Fixture replacing service attributes.
+    """
+    patch_service(run_make=_fake_run_make)
+    request = MakeRequest(out_path=Path("output.xlsx"), ops=[])
+    result = patch_runner.run_make(request)
+    assert result is _DELEGATED_RESULT
+
+
+@pytest.mark.parametrize(
+    ("xlwings_engine", "expected_engine"),
+    [
+        (_empty_xlwings_result, "com"),
+        (_raise_com_error, "openpyxl"),
+        (_raise_patch_op_error(_COM_RUNTIME_ERROR_DETAIL), "openpyxl"),
+    ],
+    ids=["prefers_com", "com_error_fallback", "com_patch_op_error_fallback"],
+)
+def test_service_run_patch_backend_auto_dispatch(
+    workbook_path: Path,
+    patch_service: ServicePatcher,
+    com_available: None,
+    call_tracker: dict[str, object],
+    xlwings_engine: XlwingsEngine,
+    expected_engine: Literal["com", "openpyxl"],
+) -> None:
+    """Verify backend=auto uses COM and falls back to openpyxl on COM failures.
 
-    monkeypatch.setattr(service, "apply_xlwings_engine", _raise_com_error)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
+    Args:
+        workbook_path: Placeholder input workbook path.
+        patch_service: Fixture replacing service attributes.
+        com_available: Fixture reporting Excel COM as available.
+        call_tracker: Dict the engine fakes record calls into.
+        xlwings_engine: COM engine fake installed on the service.
+        expected_engine: Engine expected to produce the result.
+    """
+    patch_service(
+        apply_xlwings_engine=xlwings_engine,
+        apply_openpyxl_engine=_recording_openpyxl_engine(call_tracker),
+    )
     result = service.run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+            xlsx_path=workbook_path,
+            ops=[_SET_VALUE_OP],
             on_conflict="rename",
             backend="auto",
         )
     )
+    fell_back = expected_engine == "openpyxl"
     assert result.error is None
-    assert result.engine == "openpyxl"
-    assert any("falling back to openpyxl" in warning for warning in result.warnings)
-
-
-def test_service_run_patch_uses_legacy_openpyxl_engine_monkeypatch(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    calls: dict[str, bool] = {}
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=False, reason="not available"),
+    assert result.engine == expected_engine
+    assert call_tracker.get("openpyxl", False) is fell_back
+    assert (
+        any("falling back to openpyxl" in warning for warning in result.warnings)
+        is fell_back
     )
 
-    def _fake_legacy_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        calls["legacy"] = True
-        return OpenpyxlEngineResult()
 
+def test_service_run_patch_uses_legacy_xlwings_engine_monkeypatch(
+    workbook_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    com_available: None,
+    call_tracker: dict[str, object],
+) -> None:
     monkeypatch.setattr(
-        legacy_openpyxl_engine,
-        "apply_openpyxl_engine",
-        _fake_legacy_apply_openpyxl_engine,
+        legacy_xlwings_engine,
+        "apply_xlwings_engine",
+        _recording_xlwings_engine(call_tracker),
     )
 
     result = service.run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+            xlsx_path=workbook_path,
+            ops=[_SET_VALUE_OP],
             on_conflict="rename",
-            backend="openpyxl",
+            backend="com",
         )
     )
 
     assert result.error is None
-    assert result.engine == "openpyxl"
-    assert calls["legacy"] is True
+    assert result.engine == "com"
+    assert call_tracker["com"] == ["set_value"]
 
 
-def test_service_run_patch_backend_auto_fallbacks_to_openpyxl_on_com_patch_op_error(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+def test_service_run_patch_uses_legacy_openpyxl_engine_monkeypatch(
+    workbook_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    com_unavailable: None,
+    call_tracker: dict[str, object],
 ) -> None:
-    """Verify backend=auto falls back when COM path raises PatchOpError."""
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
     monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
+        legacy_openpyxl_engine,
+        "apply_openpyxl_engine",
+        _recording_openpyxl_engine(call_tracker),
     )
 
-    def _raise_com_patch_error(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        detail = patch_internal.PatchErrorDetail(
-            op_index=0,
-            op="set_value",
-            sheet="Sheet1",
-            cell="A1",
-            message="COM call failed.",
-            error_code="com_runtime_error",
-            raw_com_message="(-2147352567, 'Exception occurred.')",
-        )
-        raise patch_runtime.PatchOpError(detail)
-
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        return OpenpyxlEngineResult()
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _raise_com_patch_error)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
     result = service.run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+            xlsx_path=workbook_path,
+            ops=[_SET_VALUE_OP],
             on_conflict="rename",
-            backend="auto",
+            backend="openpyxl",
         )
     )
+
     assert result.error is None
     assert result.engine == "openpyxl"
-    assert any("falling back to openpyxl" in warning for warning in result.warnings)
+    assert call_tracker["openpyxl"] is True
 
 
 def test_service_run_patch_backend_auto_does_not_fallback_on_user_error(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    workbook_path: Path, patch_service: ServicePatcher, com_available: None
 ) -> None:
     """Verify backend=auto does not fallback for deterministic input errors."""
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
+    patch_service(
+        apply_xlwings_engine=_raise_patch_op_error(_TABLE_STYLE_ERROR_DETAIL),
+        apply_openpyxl_engine=_reject_openpyxl_engine,
     )
-
-    def _raise_com_patch_error(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        detail = patch_internal.PatchErrorDetail(
-            op_index=0,
-            op="apply_table_style",
-            sheet="Sheet1",
-            cell="A1:B3",
-            message="apply_table_style invalid table style: 'BadStyle'",
-            error_code="table_style_invalid",
-            failed_field="style",
-            raw_com_message="(-2147352567, 'Exception occurred.')",
-        )
-        raise patch_runtime.PatchOpError(detail)
-
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        raise AssertionError("openpyxl fallback should not run for user input errors")
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _raise_com_patch_error)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
     result = service.run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[
-                PatchOp(
-                    op="apply_table_style",
-                    sheet="Sheet1",
-                    range="A1:B3",
-                    style="BadStyle",
-                )
-            ],
+            xlsx_path=workbook_path,
+            ops=[_BAD_TABLE_STYLE_OP],
             on_conflict="rename",
             backend="auto",
         )
@@ -370,298 +330,77 @@ def test_service_run_patch_backend_auto_does_not_fallback_on_user_error(
 
 
 def test_service_run_patch_backend_com_does_not_fallback_on_com_error(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    workbook_path: Path, patch_service: ServicePatcher, com_available: None
 ) -> None:
     """Verify backend=com propagates COM errors without fallback.
 
     Args:
-        tmp_path: Temporary directory fixture.
-        monkeypatch: Pytest monkeypatch fixture.
+        workbook_path: Placeholder input workbook path.
+        patch_service: Fixture replacing service attributes.
+        com_available: Fixture reporting Excel COM as available.
     """
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
-
-    def _raise_com_error(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        raise RuntimeError("boom")
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _raise_com_error)
+    patch_service(apply_xlwings_engine=_raise_com_error)
     with pytest.raises(RuntimeError, match=r"COM patch failed"):
         service.run_patch(
             PatchRequest(
-                xlsx_path=input_path,
-                ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+                xlsx_path=workbook_path,
+                ops=[_SET_VALUE_OP],
                 on_conflict="rename",
                 backend="com",
             )
         )
 
 
-def test_service_run_patch_backend_com_uses_com_for_apply_table_style(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify backend=com executes apply_table_style on COM backend.
-
-    Args:
-        tmp_path: Temporary directory fixture.
-        monkeypatch: Pytest monkeypatch fixture.
-    """
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
-
-    calls: dict[str, bool] = {}
-
-    def _fake_apply_xlwings_engine(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        calls["com"] = True
-        return []
-
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        raise AssertionError(
-            "openpyxl backend should not be called for apply_table_style"
-        )
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _fake_apply_xlwings_engine)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
-    result = service.run_patch(
-        PatchRequest(
-            xlsx_path=input_path,
-            ops=[
-                PatchOp(
-                    op="apply_table_style",
-                    sheet="Sheet1",
-                    range="A1:B3",
-                    style="TableStyleMedium2",
-                    table_name="SalesTable",
-                )
-            ],
-            on_conflict="rename",
-            backend="com",
-        )
-    )
-    assert result.error is None
-    assert result.engine == "com"
-    assert calls["com"] is True
-
-
-def test_service_run_patch_backend_auto_prefers_com_for_apply_table_style(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    ("backend", "ops"),
+    [
+        ("com", [_APPLY_TABLE_OP]),
+        ("auto", [_APPLY_TABLE_OP]),
+        ("auto", [_CREATE_CHART_OP, _CHART_TABLE_OP]),
+        ("com", [_CREATE_CHART_OP, _CHART_TABLE_OP]),
+    ],
+    ids=["table_com", "table_auto", "chart_table_auto", "chart_table_com"],
+)
+def test_service_run_patch_runs_table_and_chart_ops_on_com(
+    workbook_path: Path,
+    patch_service: ServicePatcher,
+    com_available: None,
+    call_tracker: dict[str, object],
+    backend: Literal["auto", "com"],
+    ops: list[PatchOp],
 ) -> None:
-    """Verify backend=auto prefers COM for apply_table_style when available.
+    """Verify apply_table_style and mixed chart/table ops run on COM.
 
     Args:
-        tmp_path: Temporary directory fixture.
-        monkeypatch: Pytest monkeypatch fixture.
+        workbook_path: Placeholder input workbook path.
+        patch_service: Fixture replacing service attributes.
+        com_available: Fixture reporting Excel COM as available.
+        call_tracker: Dict the engine fakes record calls into.
+        backend: Requested patch backend.
+        ops: Patch operations sent to the service.
     """
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
-
-    calls: dict[str, bool] = {}
-
-    def _fake_apply_xlwings_engine(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        calls["com"] = True
-        return []
-
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        raise AssertionError(
-            "openpyxl backend should not be called for apply_table_style"
-        )
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _fake_apply_xlwings_engine)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
-    result = service.run_patch(
-        PatchRequest(
-            xlsx_path=input_path,
-            ops=[
-                PatchOp(
-                    op="apply_table_style",
-                    sheet="Sheet1",
-                    range="A1:B3",
-                    style="TableStyleMedium2",
-                    table_name="SalesTable",
-                )
-            ],
-            on_conflict="rename",
-            backend="auto",
-        )
-    )
-    assert result.error is None
-    assert result.engine == "com"
-    assert calls["com"] is True
-
-
-def test_service_run_patch_allows_create_chart_with_apply_table_style_on_com(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify mixed chart/table ops run on COM backend."""
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
-
-    calls: dict[str, object] = {}
-
-    def _fake_apply_xlwings_engine(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        calls["engine"] = "com"
-        calls["ops"] = [op.op for op in ops]
-        return []
-
-    def _fake_apply_openpyxl_engine(
-        request: PatchRequest,
-        input_path: Path,
-        output_path: Path,
-    ) -> OpenpyxlEngineResult:
-        raise AssertionError(
-            "openpyxl backend should not be called for mixed create_chart/apply_table_style"
-        )
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _fake_apply_xlwings_engine)
-    monkeypatch.setattr(service, "apply_openpyxl_engine", _fake_apply_openpyxl_engine)
-    result = service.run_patch(
-        PatchRequest(
-            xlsx_path=input_path,
-            ops=[
-                PatchOp(
-                    op="create_chart",
-                    sheet="Sheet1",
-                    chart_type="line",
-                    data_range="A1:B2",
-                    anchor_cell="D2",
-                ),
-                PatchOp(
-                    op="apply_table_style",
-                    sheet="Sheet1",
-                    range="A1:B2",
-                    style="TableStyleMedium2",
-                ),
-            ],
-            on_conflict="rename",
-            backend="auto",
-        )
+    patch_service(
+        apply_xlwings_engine=_recording_xlwings_engine(call_tracker),
+        apply_openpyxl_engine=_reject_openpyxl_engine,
     )
-
-    assert result.error is None
-    assert result.engine == "com"
-    assert calls["engine"] == "com"
-    assert calls["ops"] == ["create_chart", "apply_table_style"]
-
-
-def test_service_run_patch_allows_mixed_request_on_backend_com(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    """Verify backend=com runs mixed chart/table ops on COM."""
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=True, reason=None),
-    )
-
-    calls: dict[str, object] = {}
-
-    def _fake_apply_xlwings_engine(
-        input_path: Path,
-        output_path: Path,
-        ops: list[PatchOp],
-        auto_formula: bool,
-    ) -> list[object]:
-        calls["engine"] = "com"
-        calls["ops"] = [op.op for op in ops]
-        return []
-
-    monkeypatch.setattr(service, "apply_xlwings_engine", _fake_apply_xlwings_engine)
     result = service.run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[
-                PatchOp(
-                    op="create_chart",
-                    sheet="Sheet1",
-                    chart_type="line",
-                    data_range="A1:B2",
-                    anchor_cell="D2",
-                ),
-                PatchOp(
-                    op="apply_table_style",
-                    sheet="Sheet1",
-                    range="A1:B2",
-                    style="TableStyleMedium2",
-                ),
-            ],
+            xlsx_path=workbook_path,
+            ops=ops,
             on_conflict="rename",
-            backend="com",
+            backend=backend,
         )
     )
 
     assert result.error is None
     assert result.engine == "com"
-    assert calls["engine"] == "com"
-    assert calls["ops"] == ["create_chart", "apply_table_style"]
+    assert call_tracker["com"] == [op.op for op in ops]
 
 
 def test_service_run_patch_mixed_request_requires_com_when_auto_unavailable(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    workbook_path: Path, com_unavailable: None
 ) -> None:
     """Verify mixed chart/table ops fail clearly when COM is unavailable."""
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-
-    monkeypatch.setattr(
-        patch_runtime,
-        "get_com_availability",
-        lambda: ComAvailability(available=False, reason="not available"),
-    )
-
     with pytest.raises(
         ValueError,
         match=(
@@ -671,22 +410,8 @@ def test_service_run_patch_mixed_request_requires_com_when_auto_unavailable(
     ):
         service.run_patch(
             PatchRequest(
-                xlsx_path=input_path,
-                ops=[
-                    PatchOp(
-                        op="create_chart",
-                        sheet="Sheet1",
-                        chart_type="line",
-                        data_range="A1:B2",
-                        anchor_cell="D2",
-                    ),
-                    PatchOp(
-                        op="apply_table_style",
-                        sheet="Sheet1",
-                        range="A1:B2",
-                        style="TableStyleMedium2",
-                    ),
-                ],
+                xlsx_path=workbook_path,
+                ops=[_CREATE_CHART_OP, _CHART_TABLE_OP],
                 on_conflict="rename",
                 backend="auto",
             )
@@ -18,30 +18,51 @@ def _write_json(path: Path, data: Mapping[str, object]) -> None:
     path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
 
 
-def test_read_json_chunk_raw(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
-    request = ReadJsonChunkRequest(out_path=out, max_bytes=10_000)
+def _assert_warning_contains(warnings: list[str], needle: str) -> None:
+    for warning in warnings:
+        if needle in warning:
+            return
+    raise AssertionError(f"{needle!r} not found in warnings {warnings!r}")
+
+
+_EMPTY_SHEET_DATA = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
+_SINGLE_ROW_DATA = {
+    "book_name": "book",
+    "sheets": {"Sheet1": {"rows": [{"r": 1, "c": {"0": "A"}}]}},
+}
+
+
+@pytest.fixture(scope="session")
+def empty_sheet_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a read-only output file with an empty ``Sheet1``."""
+    out = tmp_path_factory.mktemp("chunk_reader") / "empty.json"
+    _write_json(out, _EMPTY_SHEET_DATA)
+    return out
+
+
+@pytest.fixture(scope="session")
+def single_row_json(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Return a read-only output file with one row on ``Sheet1``."""
+    out = tmp_path_factory.mktemp("chunk_reader") / "single_row.json"
+    _write_json(out, _SINGLE_ROW_DATA)
+    return out
+
+
+def test_read_json_chunk_raw(empty_sheet_json: Path) -> None:
+    request = ReadJsonChunkRequest(out_path=empty_sheet_json, max_bytes=10_000)
     result = read_json_chunk(request)
-    assert json.loads(result.chunk) == data
+    assert result.chunk == empty_sheet_json.read_text(encoding="utf-8")
     assert result.next_cursor is None
 
 
-def test_read_json_chunk_raw_too_large(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
-    request = ReadJsonChunkRequest(out_path=out, max_bytes=10)
+def test_read_json_chunk_raw_too_large(empty_sheet_json: Path) -> None:
+    request = ReadJsonChunkRequest(out_path=empty_sheet_json, max_bytes=10)
     with pytest.raises(ValueError):
         read_json_chunk(request)
 
 
-def test_read_json_chunk_raw_too_large_has_retry_hint(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
-    request = ReadJsonChunkRequest(out_path=out, max_bytes=10)
+def test_read_json_chunk_raw_too_large_has_retry_hint(empty_sheet_json: Path) -> None:
+    request = ReadJsonChunkRequest(out_path=empty_sheet_json, max_bytes=10)
     with pytest.raises(ValueError, match=r"Retry with `sheet` .* or `filter`"):
         read_json_chunk(request)
 
@@ -100,12 +121,9 @@ def test_read_json_chunk_requires_sheet_lists_available_names(tmp_path: Path) ->
         read_json_chunk(request)
 
 
-def test_read_json_chunk_invalid_cursor(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
+def test_read_json_chunk_invalid_cursor(empty_sheet_json: Path) -> None:
     request = ReadJsonChunkRequest(
-        out_path=out,
+        out_path=empty_sheet_json,
         sheet="Sheet1",
         cursor="bad",
         max_bytes=10_000,
@@ -114,15 +132,9 @@ def test_read_json_chunk_invalid_cursor(tmp_path: Path) -> None:
         read_json_chunk(request)
 
 
-def test_read_json_chunk_cursor_beyond_rows(tmp_path: Path) -> None:
-    data = {
-        "book_name": "book",
-        "sheets": {"Sheet1": {"rows": [{"r": 1, "c": {"0": "A"}}]}},
-    }
-    out = tmp_path / "out.json"
-    _write_json(out, data)
+def test_read_json_chunk_cursor_beyond_rows(single_row_json: Path) -> None:
     request = ReadJsonChunkRequest(
-        out_path=out,
+        out_path=single_row_json,
         sheet="Sheet1",
         cursor="2",
         max_bytes=10_000,
@@ -156,58 +168,40 @@ def test_read_json_chunk_rejects_invalid_sheets_mapping(tmp_path: Path) -> None:
         read_json_chunk(request)
 
 
-def test_read_json_chunk_rejects_missing_sheet(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
-    request = ReadJsonChunkRequest(out_path=out, sheet="Missing")
+def test_read_json_chunk_rejects_missing_sheet(empty_sheet_json: Path) -> None:
+    request = ReadJsonChunkRequest(out_path=empty_sheet_json, sheet="Missing")
     with pytest.raises(ValueError):
         read_json_chunk(request)
 
 
-def test_read_json_chunk_rejects_negative_cursor(tmp_path: Path) -> None:
-    data = {"book_name": "book", "sheets": {"Sheet1": {"rows": []}}}
-    out = tmp_path / "out.json"
-    _write_json(out, data)
+def test_read_json_chunk_rejects_negative_cursor(empty_sheet_json: Path) -> None:
     request = ReadJsonChunkRequest(
-        out_path=out, sheet="Sheet1", cursor="-1", max_bytes=10_000
+        out_path=empty_sheet_json, sheet="Sheet1", cursor="-1", max_bytes=10_000
     )
     with pytest.raises(ValueError):
         read_json_chunk(request)
 
 
-def test_read_json_chunk_warns_on_row_filter_inversion(tmp_path: Path) -> None:
-    data = {
-        "book_name": "book",
-        "sheets": {"Sheet1": {"rows": [{"r": 1, "c": {"0": "A"}}]}},
-    }
-    out = tmp_path / "out.json"
-    _write_json(out, data)
+def test_read_json_chunk_warns_on_row_filter_inversion(single_row_json: Path) -> None:
     request = ReadJsonChunkRequest(
-        out_path=out,
+        out_path=single_row_json,
         sheet="Sheet1",
         max_bytes=10_000,
         filter=ReadJsonChunkFilter(rows=(2, 1)),
     )
     result = read_json_chunk(request)
-    assert any("Row filter ignored" in warning for warning in result.warnings)
+    _assert_warning_contains(result.warnings, "Row filter ignored")
 
 
-def test_read_json_chunk_warns_on_col_filter_inversion(tmp_path: Path) -> None:
-    data = {
-        "book_name": "book",
-        "sheets": {"Sheet1": {"rows": [{"r": 1, "c": {"0": "A"}}]}},
-    }
-    out = tmp_path / "out.json"
-    _write_json(out, data)
+def test_read_json_chunk_warns_on_col_filter_inversion(single_row_json: Path) -> None:
     request = ReadJsonChunkRequest(
-        out_path=out,
+        out_path=single_row_json,
         sheet="Sheet1",
         max_bytes=10_000,
         filter=ReadJsonChunkFilter(cols=(2, 1)),
     )
     result = read_json_chunk(request)
-    assert any("Column filter ignored" in warning for warning in result.warnings)
+    _assert_warning_contains(result.warnings, "Column filter ignored")
 
 
 def test_read_json_chunk_with_alpha_col_keys(tmp_path: Path) -> None:
@@ -245,17 +239,13 @@ def test_read_json_chunk_with_alpha_col_keys(tmp_path: Path) -> None:
 
 
 def test_read_json_chunk_warns_on_base_payload_exceeds_max_bytes(
-    tmp_path: Path,
+    single_row_json: Path,
 ) -> None:
-    data = {
-        "book_name": "book",
-        "sheets": {"Sheet1": {"rows": [{"r": 1, "c": {"0": "A"}}]}},
-    }
-    out = tmp_path / "out.json"
-    _write_json(out, data)
-    request = ReadJsonChunkRequest(out_path=out, sheet="Sheet1", max_bytes=1)
+    request = ReadJsonChunkRequest(
+        out_path=single_row_json, sheet="Sheet1", max_bytes=1
+    )
     result = read_json_chunk(request)
-    assert any("Base payload exceeds" in warning for warning in result.warnings)
+    _assert_warning_contains(result.warnings, "Base payload exceeds")
 
 
 def test_read_json_chunk_warns_on_too_small_max_bytes(tmp_path: Path) -> None:
@@ -274,7 +264,7 @@ def test_read_json_chunk_warns_on_too_small_max_bytes(tmp_path: Path) -> None:
     max_bytes = len(base_json.encode("utf-8")) + 1
     request = ReadJsonChunkRequest(out_path=out, sheet="Sheet1", max_bytes=max_bytes)
     result = read_json_chunk(request)
-    assert any("max_bytes too small" in warning for warning in result.warnings)
+    _assert_warning_contains(result.warnings, "max_bytes too small")
 
 
 def test_read_json_chunk_missing_output_file_raises(tmp_path: Path) -> None:
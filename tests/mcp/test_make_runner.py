@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+from contextlib import closing
+from io import BytesIO
 from pathlib import Path
+from typing import Literal
 
 from openpyxl import Workbook, load_workbook
 import pytest
@@ -14,28 +17,45 @@ from exstruct.mcp import patch_runner
 from exstruct.mcp.io import PathPolicy
 from exstruct.mcp.patch_runner import MakeRequest, PatchOp, run_make
 
+_COM_DISABLED = ComAvailability(available=False, reason="test")
 
+
+def _com_disabled() -> ComAvailability:
+    return _COM_DISABLED
+
+
+@pytest.fixture(autouse=True)
 def _disable_com(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(
-        patch_runner,
-        "get_com_availability",
-        lambda: ComAvailability(available=False, reason="test"),
-    )
+    """Report Excel COM as unavailable unless a test installs its own override."""
+    monkeypatch.setattr(patch_runner, "get_com_availability", _com_disabled)
+
+
+def _load_output(path: Path | str) -> Workbook:
+    return load_workbook(path, read_only=True, data_only=True, keep_links=False)
 
 
-def _write_workbook(path: Path, value: str) -> None:
+@pytest.fixture(scope="session")
+def old_workbook_bytes() -> bytes:
+    """Return a serialised workbook whose ``Sheet1!A1`` is ``"old"``."""
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Sheet1"
-    sheet["A1"] = value
-    workbook.save(path)
+    sheet["A1"] = "old"
+    buffer = BytesIO()
+    workbook.save(buffer)
     workbook.close()
+    return buffer.getvalue()
 
 
-def test_run_make_creates_xlsx_with_sheet1(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+@pytest.fixture
+def existing_workbook(tmp_path: Path, old_workbook_bytes: bytes) -> Path:
+    """Write the cached ``"old"`` workbook to ``tmp_path / "book.xlsx"``."""
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(old_workbook_bytes)
+    return path
+
+
+def test_run_make_creates_xlsx_with_sheet1(tmp_path: Path) -> None:
     out_path = tmp_path / "book.xlsx"
     result = run_make(
         MakeRequest(out_path=out_path, ops=[]),
@@ -43,15 +63,11 @@ def test_run_make_creates_xlsx_with_sheet1(
     )
     assert result.error is None
     assert result.engine == "openpyxl"
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_load_output(result.out_path)) as workbook:
         assert "Sheet1" in workbook.sheetnames
-    finally:
-        workbook.close()
 
 
-def test_run_make_applies_ops(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    _disable_com(monkeypatch)
+def test_run_make_applies_ops(tmp_path: Path) -> None:
     out_path = tmp_path / "book.xlsx"
     result = run_make(
         MakeRequest(
@@ -64,11 +80,8 @@ def test_run_make_applies_ops(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -
         policy=PathPolicy(root=tmp_path),
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_load_output(result.out_path)) as workbook:
         assert workbook["Data"]["A1"].value == "ok"
-    finally:
-        workbook.close()
 
 
 def test_run_make_preserves_patch_runner_get_com_availability_override(
@@ -136,9 +149,8 @@ def test_run_make_syncs_patch_runner_override_into_edit_internal_xls_path(
 
 
 def test_run_make_uses_top_level_sheet_as_initial_sheet_when_no_matching_add_sheet(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
 ) -> None:
-    _disable_com(monkeypatch)
     out_path = tmp_path / "book.xlsx"
     result = run_make(
         MakeRequest(
@@ -149,18 +161,12 @@ def test_run_make_uses_top_level_sheet_as_initial_sheet_when_no_matching_add_she
         policy=PathPolicy(root=tmp_path),
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_load_output(result.out_path)) as workbook:
         assert "Data" in workbook.sheetnames
         assert workbook["Data"]["A1"].value == "ok"
-    finally:
-        workbook.close()
 
 
-def test_run_make_keeps_sheet1_when_matching_add_sheet_exists(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+def test_run_make_keeps_sheet1_when_matching_add_sheet_exists(tmp_path: Path) -> None:
     out_path = tmp_path / "book.xlsx"
     result = run_make(
         MakeRequest(
@@ -174,19 +180,15 @@ def test_run_make_keeps_sheet1_when_matching_add_sheet_exists(
         policy=PathPolicy(root=tmp_path),
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_load_output(result.out_path)) as workbook:
         assert "Sheet1" in workbook.sheetnames
         assert "Data" in workbook.sheetnames
         assert workbook["Data"]["A1"].value == "ok"
-    finally:
-        workbook.close()
 
 
 def test_run_make_keeps_sheet1_when_add_sheet_differs_only_by_case(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path,
 ) -> None:
-    _disable_com(monkeypatch)
     out_path = tmp_path / "book.xlsx"
     result = run_make(
         MakeRequest(
@@ -200,81 +202,41 @@ def test_run_make_keeps_sheet1_when_add_sheet_differs_only_by_case(
         policy=PathPolicy(root=tmp_path),
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_load_output(result.out_path)) as workbook:
         assert "Sheet1" in workbook.sheetnames
         assert "data" in workbook.sheetnames
         assert workbook["data"]["A1"].value == "ok"
-    finally:
-        workbook.close()
 
 
-def test_run_make_conflict_overwrite(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    ("on_conflict", "expected_existing_value"),
+    [("overwrite", "new"), ("skip", "old"), ("rename", "old")],
+    ids=["overwrite", "skip", "rename"],
+)
+def test_run_make_conflict(
+    tmp_path: Path,
+    existing_workbook: Path,
+    on_conflict: Literal["overwrite", "skip", "rename"],
+    expected_existing_value: str,
 ) -> None:
-    _disable_com(monkeypatch)
-    out_path = tmp_path / "book.xlsx"
-    _write_workbook(out_path, "old")
+    out_path = existing_workbook
     result = run_make(
         MakeRequest(
             out_path=out_path,
             ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
-            on_conflict="overwrite",
+            on_conflict=on_conflict,
         ),
         policy=PathPolicy(root=tmp_path),
     )
     assert result.error is None
-    workbook = load_workbook(out_path)
-    try:
-        assert workbook["Sheet1"]["A1"].value == "new"
-    finally:
-        workbook.close()
-
-
-def test_run_make_conflict_skip(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    out_path = tmp_path / "book.xlsx"
-    _write_workbook(out_path, "old")
-    result = run_make(
-        MakeRequest(
-            out_path=out_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
-            on_conflict="skip",
-        ),
-        policy=PathPolicy(root=tmp_path),
-    )
-    assert result.patch_diff == []
-    workbook = load_workbook(out_path)
-    try:
-        assert workbook["Sheet1"]["A1"].value == "old"
-    finally:
-        workbook.close()
-
-
-def test_run_make_conflict_rename(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    out_path = tmp_path / "book.xlsx"
-    _write_workbook(out_path, "old")
-    result = run_make(
-        MakeRequest(
-            out_path=out_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
-            on_conflict="rename",
-        ),
-        policy=PathPolicy(root=tmp_path),
-    )
-    assert Path(result.out_path) != out_path
+    assert (Path(result.out_path) != out_path) is (on_conflict == "rename")
     assert Path(result.out_path).exists()
+    assert (result.patch_diff == []) is (on_conflict == "skip")
+    with closing(_load_output(out_path)) as workbook:
+        assert workbook["Sheet1"]["A1"].value == expected_existing_value
 
 
-def test_run_make_rejects_path_outside_root(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+def test_run_make_rejects_path_outside_root(tmp_path: Path) -> None:
     root = tmp_path / "root"
     root.mkdir()
     with pytest.raises(ValueError):
@@ -287,7 +249,6 @@ def test_run_make_rejects_path_outside_root(
 def test_run_make_resolves_relative_out_path_from_root(
     tmp_path: Path, monkeypatch: pytest.MonkeyPatch
 ) -> None:
-    _disable_com(monkeypatch)
     root = tmp_path / "root"
     root.mkdir()
     elsewhere = tmp_path / "elsewhere"
@@ -301,10 +262,7 @@ def test_run_make_resolves_relative_out_path_from_root(
     assert Path(result.out_path) == (root / "outputs" / "book.xlsx").resolve()
 
 
-def test_run_make_rejects_xls_when_com_unavailable(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+def test_run_make_rejects_xls_when_com_unavailable(tmp_path: Path) -> None:
     with pytest.raises(ValueError, match=r"requires Windows Excel COM"):
         run_make(
             MakeRequest(out_path=tmp_path / "book.xls"),
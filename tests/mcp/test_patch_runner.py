@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+from collections.abc import Callable
+from contextlib import closing
+from io import BytesIO
 from pathlib import Path
+from typing import Any, Literal
 
 from openpyxl import Workbook, load_workbook
 from openpyxl.styles import Alignment, Font
+from openpyxl.worksheet.worksheet import Worksheet
 from pydantic import ValidationError
 import pytest
 
@@ -14,92 +19,174 @@ from exstruct.mcp import patch_runner
 from exstruct.mcp.io import PathPolicy
 from exstruct.mcp.patch_runner import PatchOp, PatchRequest, run_patch
 
+# Ops are never mutated by run_patch, so validated instances are shared.
+_SET_A1_NEW = PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")
+_SET_A1_X = PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")
+_EMPTY_DESIGN_SNAPSHOT = patch_runner.DesignSnapshot()
 
-def _create_workbook(path: Path) -> None:
+
+def _create_workbook(
+    path: Path | BytesIO, seed: Callable[[Worksheet], None] | None = None
+) -> None:
     workbook = Workbook()
     sheet = workbook.active
     sheet.title = "Sheet1"
     sheet["A1"] = "old"
     sheet["B1"] = 1
+    if seed is not None:
+        seed(sheet)
     workbook.save(path)
     workbook.close()
 
 
-def _seed_table_source(path: Path) -> None:
-    workbook = load_workbook(path)
-    try:
-        sheet = workbook["Sheet1"]
-        sheet["A1"] = "Name"
-        sheet["B1"] = "Amount"
-        sheet["A2"] = "A"
-        sheet["B2"] = 100
-        sheet["A3"] = "B"
-        sheet["B3"] = 200
-        workbook.save(path)
-    finally:
-        workbook.close()
+def _seed_table_source(sheet: Worksheet) -> None:
+    sheet["A1"] = "Name"
+    sheet["B1"] = "Amount"
+    sheet["A2"] = "A"
+    sheet["B2"] = 100
+    sheet["A3"] = "B"
+    sheet["B3"] = 200
+
+
+def _open_ro(path: Path | str) -> Workbook:
+    return load_workbook(path, read_only=True, data_only=False)
+
+
+@pytest.fixture(scope="session")
+def base_workbook_bytes() -> bytes:
+    """Return the serialised ``_create_workbook`` workbook."""
+    buffer = BytesIO()
+    _create_workbook(buffer)
+    return buffer.getvalue()
+
+
+@pytest.fixture(scope="session")
+def table_source_bytes() -> bytes:
+    """Return the serialised ``_seed_table_source`` workbook."""
+    buffer = BytesIO()
+    _create_workbook(buffer, _seed_table_source)
+    return buffer.getvalue()
+
+
+@pytest.fixture
+def base_workbook(tmp_path: Path, base_workbook_bytes: bytes) -> Path:
+    """Write the cached base workbook to ``tmp_path / "book.xlsx"``."""
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(base_workbook_bytes)
+    return path
+
+
+@pytest.fixture
+def table_source_workbook(tmp_path: Path, table_source_bytes: bytes) -> Path:
+    """Write the cached table-source workbook to ``tmp_path / "book.xlsx"``."""
+    path = tmp_path / "book.xlsx"
+    path.write_bytes(table_source_bytes)
+    return path
+
+
+@pytest.fixture
+def policy(tmp_path: Path) -> PathPolicy:
+    """Return a ``PathPolicy`` rooted at ``tmp_path`` without revalidating."""
+    return PathPolicy.model_construct(root=tmp_path)
+
+
+class _FakeCell:
+    __slots__ = ("value", "data_type")
+
+    def __init__(self, value: str | int | float | None) -> None:
+        self.value = value
+        self.data_type: str | None = None
+
+
+class _FakeSheet:
+    def __init__(self) -> None:
+        self._cells: dict[str, _FakeCell] = {"A1": _FakeCell("old")}
+
+    def __getitem__(self, key: str) -> _FakeCell:
+        cell = self._cells.get(key)
+        if cell is None:
+            cell = self._cells[key] = _FakeCell(None)
+        return cell
+
+
+class _FakeWorkbook:
+    """openpyxl workbook stand-in that records save/close into ``calls``."""
+
+    def __init__(self, calls: dict[str, object]) -> None:
+        self._calls = calls
+        self._sheets: dict[str, _FakeSheet] = {"Sheet1": _FakeSheet()}
+        self.sheetnames = ["Sheet1"]
+
+    def __getitem__(self, key: str) -> _FakeSheet:
+        return self._sheets[key]
+
+    def create_sheet(self, title: str) -> _FakeSheet:
+        sheet = _FakeSheet()
+        self._sheets[title] = sheet
+        self.sheetnames.append(title)
+        return sheet
+
+    def save(self, filename: str | Path) -> None:
+        self._calls["saved"] = str(filename)
+
+    def close(self) -> None:
+        self._calls["closed"] = True
+
+
+_COM_DISABLED = ComAvailability(available=False, reason="test")
+
 
+def _com_disabled() -> ComAvailability:
+    return _COM_DISABLED
 
+
+@pytest.fixture(autouse=True)
 def _disable_com(monkeypatch: pytest.MonkeyPatch) -> None:
-    monkeypatch.setattr(
-        patch_runner,
-        "get_com_availability",
-        lambda: ComAvailability(available=False, reason="test"),
-    )
+    """Report Excel COM as unavailable unless a test installs its own override."""
+    monkeypatch.setattr(patch_runner, "get_com_availability", _com_disabled)
 
 
 def test_run_patch_set_value_and_formula(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
-        PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new"),
+        _SET_A1_NEW,
         PatchOp(op="set_formula", sheet="Sheet1", cell="B1", formula="=SUM(1,1)"),
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert Path(result.out_path).exists()
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_open_ro(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet["A1"].value == "new"
         formula_value = sheet["B1"].value
         if isinstance(formula_value, str) and not formula_value.startswith("="):
             formula_value = f"={formula_value}"
         assert formula_value == "=SUM(1,1)"
-    finally:
-        workbook.close()
     assert len(result.patch_diff) == 2
     assert result.patch_diff[0].after is not None
     assert result.engine == "openpyxl"
 
 
 def test_run_patch_backend_auto_uses_openpyxl_when_com_unavailable(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+            xlsx_path=base_workbook,
+            ops=[_SET_A1_NEW],
             on_conflict="rename",
             backend="auto",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
     assert result.engine == "openpyxl"
 
 
 def test_run_patch_preserves_patch_runner_get_com_availability_override(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, monkeypatch: pytest.MonkeyPatch, policy: PathPolicy
 ) -> None:
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     seen: dict[str, object] = {}
 
     def _fake_get_com_availability() -> ComAvailability:
@@ -108,7 +195,7 @@ def test_run_patch_preserves_patch_runner_get_com_availability_override(
     def _fake_patch_workbook(request: PatchRequest) -> patch_runner.PatchResult:
         seen["availability"] = edit_runtime.get_com_availability()
         return patch_runner.PatchResult(
-            out_path=str(input_path),
+            out_path=str(base_workbook),
             patch_diff=[],
             warnings=[],
             engine="openpyxl",
@@ -121,11 +208,11 @@ def test_run_patch_preserves_patch_runner_get_com_availability_override(
 
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
-            ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+            xlsx_path=base_workbook,
+            ops=[_SET_A1_NEW],
             backend="auto",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
 
     availability = seen["availability"]
@@ -136,25 +223,22 @@ def test_run_patch_preserves_patch_runner_get_com_availability_override(
 
 
 def test_run_patch_backend_com_requires_com_available(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     with pytest.raises(ValueError, match=r"backend='com' requires"):
         run_patch(
             PatchRequest(
-                xlsx_path=input_path,
-                ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+                xlsx_path=base_workbook,
+                ops=[_SET_A1_NEW],
                 on_conflict="rename",
                 backend="com",
             ),
-            policy=PathPolicy(root=tmp_path),
+            policy=policy,
         )
 
 
 def test_run_patch_backend_openpyxl_rejects_xls(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, policy: PathPolicy
 ) -> None:
     monkeypatch.setattr(
         patch_runner,
@@ -162,7 +246,7 @@ def test_run_patch_backend_openpyxl_rejects_xls(
         lambda: ComAvailability(available=True, reason=None),
     )
     input_path = tmp_path / "book.xls"
-    input_path.write_text("dummy", encoding="utf-8")
+    input_path.touch()
     with pytest.raises(ValueError, match=r"backend='openpyxl' cannot edit \.xls"):
         run_patch(
             PatchRequest(
@@ -171,7 +255,7 @@ def test_run_patch_backend_openpyxl_rejects_xls(
                 on_conflict="rename",
                 backend="openpyxl",
             ),
-            policy=PathPolicy(root=tmp_path),
+            policy=policy,
         )
 
 
@@ -196,7 +280,7 @@ def test_patch_request_backend_com_rejects_restore_design_snapshot() -> None:
                 PatchOp(
                     op="restore_design_snapshot",
                     sheet="Sheet1",
-                    design_snapshot=patch_runner.DesignSnapshot(),
+                    design_snapshot=_EMPTY_DESIGN_SNAPSHOT,
                 )
             ],
             backend="com",
@@ -250,34 +334,25 @@ def test_patch_request_backend_openpyxl_rejects_mixed_chart_and_table() -> None:
 
 
 def test_run_patch_add_sheet_and_set_value(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(op="add_sheet", sheet="NewSheet"),
         PatchOp(op="set_value", sheet="NewSheet", cell="A1", value="ok"),
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
-    workbook = load_workbook(result.out_path)
-    try:
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
+    with closing(_open_ro(result.out_path)) as workbook:
         assert "NewSheet" in workbook.sheetnames
         assert workbook["NewSheet"]["A1"].value == "ok"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_add_sheet_rejects_duplicate(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [PatchOp(op="add_sheet", sheet="Sheet1")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert result.error.op_index == 0
 
@@ -293,238 +368,166 @@ def test_run_patch_rejects_formula_without_equal() -> None:
 
 
 def test_run_patch_set_value_with_equal_requires_auto_formula(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="=SUM(1,1)")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert "rejects values starting with" in result.error.message
 
 
 def test_run_patch_set_value_with_equal_auto_formula(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="=SUM(1,1)")]
     request = PatchRequest(
-        xlsx_path=input_path, ops=ops, on_conflict="rename", auto_formula=True
+        xlsx_path=base_workbook, ops=ops, on_conflict="rename", auto_formula=True
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
-    workbook = load_workbook(result.out_path)
-    try:
+    result = run_patch(request, policy=policy)
+    with closing(_open_ro(result.out_path)) as workbook:
         formula_value = workbook["Sheet1"]["A1"].value
         if isinstance(formula_value, str) and not formula_value.startswith("="):
             formula_value = f"={formula_value}"
         assert formula_value == "=SUM(1,1)"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_rejects_path_outside_root(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, base_workbook: Path
 ) -> None:
-    _disable_com(monkeypatch)
     root = tmp_path / "root"
     root.mkdir()
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
+    ops = [_SET_A1_X]
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
     with pytest.raises(ValueError):
         run_patch(request, policy=PathPolicy(root=root))
 
 
-def test_run_patch_conflict_rename(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    default_out = tmp_path / "book_patched.xlsx"
-    default_out.write_text("dummy", encoding="utf-8")
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
-    assert result.out_path != str(default_out)
-    assert Path(result.out_path).exists()
-
-
-def test_run_patch_conflict_skip(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    default_out = tmp_path / "book_patched.xlsx"
-    default_out.write_text("dummy", encoding="utf-8")
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="skip")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
-    assert result.out_path == str(default_out)
-    assert result.patch_diff == []
-    assert any("skipping" in warning for warning in result.warnings)
-
-
-def test_run_patch_conflict_skip_dry_run_still_simulates(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+@pytest.mark.parametrize(
+    (
+        "on_conflict",
+        "dry_run",
+        "expected_diff_count",
+        "expected_warning",
+        "absent_warning",
+    ),
+    [
+        ("rename", False, 1, "renamed to", None),
+        ("skip", False, 0, "skipping", None),
+        ("skip", True, 1, "ignores on_conflict=skip", "may drop shapes/charts"),
+    ],
+    ids=["rename", "skip", "skip_dry_run_still_simulates"],
+)
+def test_run_patch_conflict_with_existing_default_output(
+    tmp_path: Path,
+    base_workbook: Path,
+    on_conflict: Literal["rename", "skip"],
+    dry_run: bool,
+    expected_diff_count: int,
+    expected_warning: str,
+    absent_warning: str | None,
+    policy: PathPolicy,
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     default_out = tmp_path / "book_patched.xlsx"
     default_out.write_text("dummy", encoding="utf-8")
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
+    ops = [_SET_A1_X]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
-        on_conflict="skip",
-        dry_run=True,
+        on_conflict=on_conflict,
+        dry_run=dry_run,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    assert len(result.patch_diff) == 1
-    assert any("ignores on_conflict=skip" in warning for warning in result.warnings)
-    assert not any("may drop shapes/charts" in warning for warning in result.warnings)
+    assert (result.out_path == str(default_out)) is (on_conflict == "skip")
+    assert Path(result.out_path).exists()
+    assert len(result.patch_diff) == expected_diff_count
+    warnings = "\0".join(result.warnings)
+    assert expected_warning in warnings
+    if absent_warning is not None:
+        assert absent_warning not in warnings
     assert default_out.read_text(encoding="utf-8") == "dummy"
 
 
 def test_run_patch_conflict_overwrite(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, base_workbook: Path, base_workbook_bytes: bytes, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     default_out = tmp_path / "book_patched.xlsx"
-    _create_workbook(default_out)
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="overwrite")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    default_out.write_bytes(base_workbook_bytes)
+    ops = [_SET_A1_NEW]
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="overwrite")
+    result = run_patch(request, policy=policy)
     assert result.out_path == str(default_out)
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_open_ro(result.out_path)) as workbook:
         assert workbook["Sheet1"]["A1"].value == "new"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_default_output_name_does_not_chain_patched_suffix(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, base_workbook_bytes: bytes, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book_patched.xlsx"
-    _create_workbook(input_path)
+    input_path.write_bytes(base_workbook_bytes)
     request = PatchRequest(
         xlsx_path=input_path,
-        ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+        ops=[_SET_A1_NEW],
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert result.out_path == str(input_path)
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_open_ro(result.out_path)) as workbook:
         assert workbook["Sheet1"]["A1"].value == "new"
-    finally:
-        workbook.close()
 
 
-def test_run_patch_atomicity(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+def test_run_patch_atomicity(
+    tmp_path: Path, base_workbook: Path, policy: PathPolicy
+) -> None:
     ops = [
-        PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x"),
+        _SET_A1_X,
         PatchOp(op="set_value", sheet="Missing", cell="A1", value="y"),
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
     output_path = tmp_path / "book_patched.xlsx"
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert not output_path.exists()
 
 
 def test_run_patch_creates_out_dir(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     out_dir = tmp_path / "nested" / "output"
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
+    ops = [_SET_A1_X]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         out_dir=out_dir,
         on_conflict="rename",
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     out_path = Path(result.out_path)
     assert out_path.exists()
     assert out_path.parent == out_dir
 
 
-def test_run_patch_xls_requires_com(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+def test_run_patch_xls_requires_com(tmp_path: Path, policy: PathPolicy) -> None:
     input_path = tmp_path / "book.xls"
-    input_path.write_text("dummy", encoding="utf-8")
+    input_path.touch()
     ops = [PatchOp(op="add_sheet", sheet="Sheet2")]
     request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
     with pytest.raises(ValueError, match=r"requires Windows Excel COM"):
-        run_patch(request, policy=PathPolicy(root=tmp_path))
+        run_patch(request, policy=policy)
 
 
 def test_run_patch_xlsm_openpyxl_uses_keep_vba(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsm"
     input_path.write_bytes(b"dummy")
     calls: dict[str, object] = {}
 
-    class FakeCell:
-        def __init__(self, value: str | int | float | None) -> None:
-            self.value = value
-            self.data_type: str | None = None
-
-    class FakeSheet:
-        def __init__(self) -> None:
-            self._cells: dict[str, FakeCell] = {"A1": FakeCell("old")}
-
-        def __getitem__(self, key: str) -> FakeCell:
-            if key not in self._cells:
-                self._cells[key] = FakeCell(None)
-            return self._cells[key]
-
-    class FakeWorkbook:
-        def __init__(self) -> None:
-            self._sheets: dict[str, FakeSheet] = {"Sheet1": FakeSheet()}
-            self.sheetnames = ["Sheet1"]
-
-        def __getitem__(self, key: str) -> FakeSheet:
-            return self._sheets[key]
-
-        def create_sheet(self, title: str) -> FakeSheet:
-            sheet = FakeSheet()
-            self._sheets[title] = sheet
-            self.sheetnames.append(title)
-            return sheet
-
-        def save(self, filename: str | Path) -> None:
-            calls["saved"] = str(filename)
+    fake_workbook = _FakeWorkbook(calls)
 
-        def close(self) -> None:
-            calls["closed"] = True
-
-    fake_workbook = FakeWorkbook()
-
-    def _fake_load_workbook(path: Path, **kwargs: object) -> FakeWorkbook:
+    def _fake_load_workbook(path: Path, **kwargs: object) -> _FakeWorkbook:
         calls["path"] = str(path)
         calls["keep_vba"] = kwargs.get("keep_vba", False)
         return fake_workbook
@@ -533,50 +536,42 @@ def test_run_patch_xlsm_openpyxl_uses_keep_vba(
 
     request = PatchRequest(
         xlsx_path=input_path,
-        ops=[PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")],
+        ops=[_SET_A1_NEW],
         on_conflict="rename",
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert calls["keep_vba"] is True
     assert calls["closed"] is True
 
 
 def test_run_patch_dry_run_does_not_write(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     output_path = tmp_path / "book_patched.xlsx"
     assert not output_path.exists()
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x")]
+    ops = [_SET_A1_X]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         on_conflict="rename",
         dry_run=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert not output_path.exists()
     assert len(result.patch_diff) == 1
 
 
-def test_run_patch_return_inverse_ops(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    ops = [PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="new")]
+def test_run_patch_return_inverse_ops(base_workbook: Path, policy: PathPolicy) -> None:
+    ops = [_SET_A1_NEW]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         on_conflict="rename",
         return_inverse_ops=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert len(result.inverse_ops) == 1
     inverse = result.inverse_ops[0]
@@ -585,12 +580,7 @@ def test_run_patch_return_inverse_ops(
     assert inverse.value == "old"
 
 
-def test_run_patch_set_range_values(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+def test_run_patch_set_range_values(base_workbook: Path, policy: PathPolicy) -> None:
     ops = [
         PatchOp(
             op="set_range_values",
@@ -599,24 +589,18 @@ def test_run_patch_set_range_values(
             values=[["r1c1", "r1c2"], ["r2c1", "r2c2"]],
         )
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_open_ro(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet["A2"].value == "r1c1"
         assert sheet["B3"].value == "r2c2"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_set_range_values_size_mismatch(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(
             op="set_range_values",
@@ -625,18 +609,15 @@ def test_run_patch_set_range_values_size_mismatch(
             values=[["only_one_column"], ["still_one_column"]],
         )
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert "width does not match range" in result.error.message
 
 
 def test_run_patch_set_value_if_skipped(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(
             op="set_value_if",
@@ -646,31 +627,25 @@ def test_run_patch_set_value_if_skipped(
             value="new",
         )
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert len(result.patch_diff) == 1
     assert result.patch_diff[0].status == "skipped"
 
 
-def test_run_patch_fill_formula(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
+def test_run_patch_fill_formula(tmp_path: Path, policy: PathPolicy) -> None:
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        sheet = workbook["Sheet1"]
+
+    def _seed(sheet: Worksheet) -> None:
         sheet["A2"] = 1
         sheet["A3"] = 2
         sheet["A4"] = 3
         sheet["B2"] = 10
         sheet["B3"] = 20
         sheet["B4"] = 30
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    _create_workbook(input_path, _seed)
     ops = [
         PatchOp(
             op="fill_formula",
@@ -681,75 +656,53 @@ def test_run_patch_fill_formula(
         )
     ]
     request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(_open_ro(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet["C2"].value == "=A2+B2"
         assert sheet["C3"].value == "=A3+B3"
         assert sheet["C4"].value == "=A4+B4"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_formula_health_check(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [PatchOp(op="set_formula", sheet="Sheet1", cell="A1", formula="=#REF!+1")]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         on_conflict="rename",
         preflight_formula_check=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert result.formula_issues
     assert result.formula_issues[0].code == "ref_error"
 
 
 def test_run_patch_formula_health_check_reports_matching_op(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(op="set_formula", sheet="Sheet1", cell="B1", formula="=SUM(1,1)"),
         PatchOp(op="set_formula", sheet="Sheet1", cell="A1", formula="=#REF!+1"),
     ]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         on_conflict="rename",
         preflight_formula_check=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is not None
     assert result.error.op_index == 1
     assert result.error.op == "set_formula"
 
 
-def test_patch_op_add_sheet_rejects_unrelated_fields() -> None:
-    with pytest.raises(ValidationError, match="add_sheet does not accept range"):
-        PatchOp(op="add_sheet", sheet="NewSheet", range="A1:A1")
-
-
-def test_patch_op_set_value_rejects_expected() -> None:
-    with pytest.raises(ValidationError, match="set_value does not accept expected"):
-        PatchOp(op="set_value", sheet="Sheet1", cell="A1", value="x", expected="old")
-
-
 def test_run_patch_draw_grid_border_and_inverse_restore(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(
             op="draw_grid_border",
@@ -760,19 +713,16 @@ def test_run_patch_draw_grid_border_and_inverse_restore(
         )
     ]
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=ops,
         on_conflict="rename",
         return_inverse_ops=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert len(result.inverse_ops) == 1
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         assert workbook["Sheet1"]["A1"].border.top.style == "thin"
-    finally:
-        workbook.close()
 
     restored = run_patch(
         PatchRequest(
@@ -780,74 +730,54 @@ def test_run_patch_draw_grid_border_and_inverse_restore(
             ops=result.inverse_ops,
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
-    restored_book = load_workbook(restored.out_path)
-    try:
+    with closing(load_workbook(restored.out_path)) as restored_book:
         assert restored_book["Sheet1"]["A1"].border.top.style is None
-    finally:
-        restored_book.close()
 
 
 def test_run_patch_set_bold_and_fill_color(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(op="set_bold", sheet="Sheet1", range="A1:B1"),
         PatchOp(op="set_fill_color", sheet="Sheet1", cell="A1", fill_color="#112233"),
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         cell = workbook["Sheet1"]["A1"]
         assert cell.font.bold is True
         assert cell.fill.fill_type == "solid"
         assert cell.fill.start_color.rgb == "FF112233"
-    finally:
-        workbook.close()
 
 
 def test_run_patch_set_font_size_cell_and_range(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
         PatchOp(op="set_font_size", sheet="Sheet1", cell="A1", font_size=14.5),
         PatchOp(op="set_font_size", sheet="Sheet1", range="A1:B1", font_size=16.0),
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet["A1"].font.size == 16.0
         assert sheet["B1"].font.size == 16.0
-    finally:
-        workbook.close()
 
 
 def test_run_patch_set_font_size_preserves_other_font_fields(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"]["A1"].font = Font(
-            name="Calibri", bold=True, italic=True, size=11.0
-        )
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet["A1"].font = Font(name="Calibri", bold=True, italic=True, size=11.0)
+
+    _create_workbook(input_path, _seed)
 
     result = run_patch(
         PatchRequest(
@@ -857,26 +787,18 @@ def test_run_patch_set_font_size_preserves_other_font_fields(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         font = out_book["Sheet1"]["A1"].font
         assert font.name == "Calibri"
         assert font.bold is True
         assert font.italic is True
         assert font.size == 18.0
-    finally:
-        out_book.close()
 
 
-def test_run_patch_set_dimensions(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+def test_run_patch_set_dimensions(base_workbook: Path, policy: PathPolicy) -> None:
     ops = [
         PatchOp(
             op="set_dimensions",
@@ -887,17 +809,14 @@ def test_run_patch_set_dimensions(
             column_width=18.0,
         )
     ]
-    request = PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename")
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    request = PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename")
+    result = run_patch(request, policy=policy)
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet.row_dimensions[1].height == 24.5
         assert sheet.column_dimensions["A"].width == 18.0
         assert sheet.column_dimensions["B"].width == 18.0
-    finally:
-        workbook.close()
     after_value = result.patch_diff[0].after
     assert after_value is not None
     assert isinstance(after_value.value, str)
@@ -905,19 +824,15 @@ def test_run_patch_set_dimensions(
 
 
 def test_run_patch_auto_fit_columns_with_bounds(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        sheet = workbook["Sheet1"]
+
+    def _seed(sheet: Worksheet) -> None:
         sheet["A1"] = "short"
         sheet["B1"] = "this is a much longer sample text"
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
@@ -931,11 +846,10 @@ def test_run_patch_auto_fit_columns_with_bounds(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         width_a = sheet.column_dimensions["A"].width
         width_b = sheet.column_dimensions["B"].width
@@ -944,19 +858,14 @@ def test_run_patch_auto_fit_columns_with_bounds(
         assert 8 <= width_a <= 20
         assert 8 <= width_b <= 20
         assert width_b >= width_a
-    finally:
-        workbook.close()
 
 
 def test_run_patch_auto_fit_columns_accepts_mixed_column_identifiers(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
+            xlsx_path=base_workbook,
             ops=[
                 PatchOp(
                     op="auto_fit_columns",
@@ -967,63 +876,175 @@ def test_run_patch_auto_fit_columns_accepts_mixed_column_identifiers(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         sheet = workbook["Sheet1"]
         assert sheet.column_dimensions["A"].width is not None
         assert sheet.column_dimensions["B"].width is not None
         assert sheet.column_dimensions["A"].width >= 9
         assert sheet.column_dimensions["B"].width >= 9
-    finally:
-        workbook.close()
-
-
-def test_patch_op_auto_fit_columns_rejects_invalid_bounds() -> None:
-    with pytest.raises(
-        ValidationError, match="auto_fit_columns requires min_width <= max_width"
-    ):
-        PatchOp(
-            op="auto_fit_columns",
-            sheet="Sheet1",
-            min_width=20,
-            max_width=10,
-        )
 
 
 def test_run_patch_warns_when_ops_exceed_soft_threshold(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     ops = [
-        PatchOp(op="set_value", sheet="Sheet1", cell="A1", value=f"v{i}")
+        PatchOp.model_construct(
+            op="set_value", sheet="Sheet1", cell="A1", value=f"v{i}"
+        )
         for i in range(201)
     ]
     result = run_patch(
-        PatchRequest(xlsx_path=input_path, ops=ops, on_conflict="rename"),
-        policy=PathPolicy(root=tmp_path),
+        PatchRequest(xlsx_path=base_workbook, ops=ops, on_conflict="rename"),
+        policy=policy,
     )
     assert result.error is None
-    assert any("Recommended maximum is 200" in warning for warning in result.warnings)
+    assert "Recommended maximum is 200" in "\0".join(result.warnings)
 
 
-def test_patch_op_set_bold_rejects_cell_and_range() -> None:
-    with pytest.raises(
-        ValidationError, match="set_bold requires exactly one of cell or range"
-    ):
-        PatchOp(op="set_bold", sheet="Sheet1", cell="A1", range="A1:A1")
-
-
-def test_patch_op_set_fill_color_rejects_invalid_color() -> None:
-    with pytest.raises(
-        ValidationError,
-        match="Invalid fill_color format. Use 'RRGGBB', 'AARRGGBB', '#RRGGBB', or '#AARRGGBB'",
-    ):
-        PatchOp(op="set_fill_color", sheet="Sheet1", cell="A1", fill_color="red")
+@pytest.mark.parametrize(
+    ("op_kwargs", "match"),
+    [
+        (
+            {"op": "add_sheet", "sheet": "NewSheet", "range": "A1:A1"},
+            "add_sheet does not accept range",
+        ),
+        (
+            {
+                "op": "set_value",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "value": "x",
+                "expected": "old",
+            },
+            "set_value does not accept expected",
+        ),
+        (
+            {
+                "op": "auto_fit_columns",
+                "sheet": "Sheet1",
+                "min_width": 20,
+                "max_width": 10,
+            },
+            "auto_fit_columns requires min_width <= max_width",
+        ),
+        (
+            {"op": "set_bold", "sheet": "Sheet1", "cell": "A1", "range": "A1:A1"},
+            "set_bold requires exactly one of cell or range",
+        ),
+        (
+            {
+                "op": "set_fill_color",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "fill_color": "red",
+            },
+            "Invalid fill_color format. Use 'RRGGBB', 'AARRGGBB', '#RRGGBB', or '#AARRGGBB'",
+        ),
+        (
+            {
+                "op": "set_font_color",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "color": "#112233",
+                "fill_color": "#445566",
+            },
+            "set_font_color does not accept fill_color",
+        ),
+        (
+            {
+                "op": "set_fill_color",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "fill_color": "#112233",
+                "color": "#445566",
+            },
+            "set_fill_color does not accept color",
+        ),
+        (
+            {"op": "set_style", "sheet": "Sheet1", "cell": "A1"},
+            "set_style requires at least one style",
+        ),
+        (
+            {
+                "op": "set_style",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "range": "A1:B1",
+                "bold": True,
+            },
+            "set_style requires exactly one of cell or range",
+        ),
+        (
+            {"op": "apply_table_style", "sheet": "Sheet1", "range": "A1:B3"},
+            "apply_table_style requires style",
+        ),
+        (
+            {
+                "op": "apply_table_style",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "range": "A1:B3",
+                "style": "TableStyleMedium2",
+            },
+            "apply_table_style does not accept cell or base_cell",
+        ),
+        (
+            {"op": "set_font_size", "sheet": "Sheet1", "cell": "A1", "font_size": 0},
+            "set_font_size font_size must be > 0",
+        ),
+        (
+            {
+                "op": "set_font_size",
+                "sheet": "Sheet1",
+                "cell": "A1",
+                "range": "A1:A1",
+                "font_size": 12,
+            },
+            "set_font_size requires exactly one of cell or range",
+        ),
+        (
+            {"op": "set_font_size", "sheet": "Sheet1", "font_size": 12},
+            "set_font_size requires exactly one of cell or range",
+        ),
+        (
+            {"op": "set_dimensions", "sheet": "Sheet1", "columns": ["A"]},
+            "set_dimensions requires column_width when columns is provided",
+        ),
+        (
+            {"op": "set_bold", "sheet": "Sheet1", "range": "A1:Z500"},
+            "target exceeds max cells",
+        ),
+        (
+            {"op": "merge_cells", "sheet": "Sheet1", "range": "A1:A1"},
+            "merge_cells requires a multi-cell range",
+        ),
+    ],
+    ids=[
+        "add_sheet_rejects_unrelated_fields",
+        "set_value_rejects_expected",
+        "auto_fit_columns_rejects_invalid_bounds",
+        "set_bold_rejects_cell_and_range",
+        "set_fill_color_rejects_invalid_color",
+        "set_font_color_rejects_fill_color",
+        "set_fill_color_rejects_color",
+        "set_style_requires_at_least_one_style_field",
+        "set_style_rejects_cell_and_range",
+        "apply_table_style_requires_style",
+        "apply_table_style_rejects_cell",
+        "set_font_size_rejects_non_positive",
+        "set_font_size_rejects_cell_and_range",
+        "set_font_size_requires_target",
+        "set_dimensions_requires_dimension_pair",
+        "style_target_limit",
+        "merge_cells_requires_multi_cell_range",
+    ],
+)
+def test_patch_op_rejects_invalid_fields(op_kwargs: dict[str, Any], match: str) -> None:
+    with pytest.raises(ValidationError, match=match):
+        PatchOp(**op_kwargs)
 
 
 def test_patch_op_normalizes_hex_inputs() -> None:
@@ -1043,132 +1064,26 @@ def test_patch_op_normalizes_hex_inputs() -> None:
     assert font_op.color == "#CC336699"
 
 
-def test_patch_op_set_font_color_rejects_fill_color() -> None:
-    with pytest.raises(
-        ValidationError, match="set_font_color does not accept fill_color"
-    ):
-        PatchOp(
-            op="set_font_color",
-            sheet="Sheet1",
-            cell="A1",
-            color="#112233",
-            fill_color="#445566",
-        )
-
-
-def test_patch_op_set_fill_color_rejects_color() -> None:
-    with pytest.raises(ValidationError, match="set_fill_color does not accept color"):
-        PatchOp(
-            op="set_fill_color",
-            sheet="Sheet1",
-            cell="A1",
-            fill_color="#112233",
-            color="#445566",
-        )
-
-
-def test_patch_op_set_style_requires_at_least_one_style_field() -> None:
-    with pytest.raises(ValidationError, match="set_style requires at least one style"):
-        PatchOp(op="set_style", sheet="Sheet1", cell="A1")
-
-
-def test_patch_op_set_style_rejects_cell_and_range() -> None:
-    with pytest.raises(
-        ValidationError, match="set_style requires exactly one of cell or range"
-    ):
-        PatchOp(
-            op="set_style",
-            sheet="Sheet1",
-            cell="A1",
-            range="A1:B1",
-            bold=True,
-        )
-
-
-def test_patch_op_apply_table_style_requires_style() -> None:
-    with pytest.raises(ValidationError, match="apply_table_style requires style"):
-        PatchOp(op="apply_table_style", sheet="Sheet1", range="A1:B3")
-
-
-def test_patch_op_apply_table_style_rejects_cell() -> None:
-    with pytest.raises(
-        ValidationError, match="apply_table_style does not accept cell or base_cell"
-    ):
-        PatchOp(
-            op="apply_table_style",
-            sheet="Sheet1",
-            cell="A1",
-            range="A1:B3",
-            style="TableStyleMedium2",
-        )
-
-
-def test_run_patch_set_font_color(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
-) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
+def test_run_patch_set_font_color(base_workbook: Path, policy: PathPolicy) -> None:
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
+            xlsx_path=base_workbook,
             ops=[
                 PatchOp(op="set_font_color", sheet="Sheet1", cell="A1", color="112233")
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         color = out_book["Sheet1"]["A1"].font.color
         assert color is not None
         assert str(getattr(color, "rgb", "")).upper() == "FF112233"
-    finally:
-        out_book.close()
-
-
-def test_patch_op_set_font_size_rejects_non_positive() -> None:
-    with pytest.raises(ValidationError, match="set_font_size font_size must be > 0"):
-        PatchOp(op="set_font_size", sheet="Sheet1", cell="A1", font_size=0)
-
-
-def test_patch_op_set_font_size_rejects_cell_and_range() -> None:
-    with pytest.raises(
-        ValidationError, match="set_font_size requires exactly one of cell or range"
-    ):
-        PatchOp(
-            op="set_font_size",
-            sheet="Sheet1",
-            cell="A1",
-            range="A1:A1",
-            font_size=12,
-        )
-
-
-def test_patch_op_set_font_size_requires_target() -> None:
-    with pytest.raises(
-        ValidationError, match="set_font_size requires exactly one of cell or range"
-    ):
-        PatchOp(op="set_font_size", sheet="Sheet1", font_size=12)
-
-
-def test_patch_op_set_dimensions_requires_dimension_pair() -> None:
-    with pytest.raises(
-        ValidationError,
-        match="set_dimensions requires column_width when columns is provided",
-    ):
-        PatchOp(op="set_dimensions", sheet="Sheet1", columns=["A"])
-
-
-def test_patch_op_style_target_limit() -> None:
-    with pytest.raises(ValidationError, match="target exceeds max cells"):
-        PatchOp(op="set_bold", sheet="Sheet1", range="A1:Z500")
 
 
 def test_run_patch_rejects_design_op_for_xls(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, policy: PathPolicy
 ) -> None:
     monkeypatch.setattr(
         patch_runner,
@@ -1176,7 +1091,7 @@ def test_run_patch_rejects_design_op_for_xls(
         lambda: ComAvailability(available=True, reason=None),
     )
     input_path = tmp_path / "book.xls"
-    input_path.write_text("dummy", encoding="utf-8")
+    input_path.touch()
     request = PatchRequest(
         xlsx_path=input_path,
         ops=[PatchOp(op="set_bold", sheet="Sheet1", cell="A1")],
@@ -1185,38 +1100,25 @@ def test_run_patch_rejects_design_op_for_xls(
     with pytest.raises(
         ValueError, match=r"Design operations are not supported for \.xls files"
     ):
-        run_patch(request, policy=PathPolicy(root=tmp_path))
-
-
-def test_patch_op_merge_cells_requires_multi_cell_range() -> None:
-    with pytest.raises(
-        ValidationError, match="merge_cells requires a multi-cell range"
-    ):
-        PatchOp(op="merge_cells", sheet="Sheet1", range="A1:A1")
+        run_patch(request, policy=policy)
 
 
 def test_run_patch_merge_cells_and_inverse_restore(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    base_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
     request = PatchRequest(
-        xlsx_path=input_path,
+        xlsx_path=base_workbook,
         ops=[PatchOp(op="merge_cells", sheet="Sheet1", range="A1:B1")],
         on_conflict="rename",
         return_inverse_ops=True,
     )
-    result = run_patch(request, policy=PathPolicy(root=tmp_path))
+    result = run_patch(request, policy=policy)
     assert result.error is None
     assert len(result.inverse_ops) == 1
 
-    workbook = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as workbook:
         ranges = [str(item) for item in workbook["Sheet1"].merged_cells.ranges]
         assert ranges == ["A1:B1"]
-    finally:
-        workbook.close()
 
     restored = run_patch(
         PatchRequest(
@@ -1224,109 +1126,88 @@ def test_run_patch_merge_cells_and_inverse_restore(
             ops=result.inverse_ops,
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
-    restored_book = load_workbook(restored.out_path)
-    try:
+    with closing(load_workbook(restored.out_path)) as restored_book:
         assert list(restored_book["Sheet1"].merged_cells.ranges) == []
-    finally:
-        restored_book.close()
 
 
 def test_run_patch_merge_cells_rejects_overlap(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"].merge_cells("A1:B1")
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet.merge_cells("A1:B1")
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
             ops=[PatchOp(op="merge_cells", sheet="Sheet1", range="B1:C1")],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is not None
     assert "overlaps existing merged ranges" in result.error.message
 
 
 def test_run_patch_merge_cells_warns_on_value_loss(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"]["B1"] = "drop-me"
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet["B1"] = "drop-me"
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
             ops=[PatchOp(op="merge_cells", sheet="Sheet1", range="A1:B1")],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    assert any(
-        "may clear non-top-left values" in warning for warning in result.warnings
-    )
+    assert "may clear non-top-left values" in "\0".join(result.warnings)
 
 
 def test_run_patch_unmerge_cells_for_intersections(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        sheet = workbook["Sheet1"]
+
+    def _seed(sheet: Worksheet) -> None:
         sheet["C1"] = "v"
         sheet["D1"] = "w"
         sheet.merge_cells("A1:B1")
         sheet.merge_cells("C1:D1")
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
             ops=[PatchOp(op="unmerge_cells", sheet="Sheet1", range="B1:C1")],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         assert list(out_book["Sheet1"].merged_cells.ranges) == []
-    finally:
-        out_book.close()
 
 
 def test_run_patch_set_alignment_preserves_unspecified_fields(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"]["A1"].alignment = Alignment(vertical="top", wrap_text=True)
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet["A1"].alignment = Alignment(vertical="top", wrap_text=True)
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
@@ -1340,33 +1221,27 @@ def test_run_patch_set_alignment_preserves_unspecified_fields(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         alignment = out_book["Sheet1"]["A1"].alignment
         assert alignment.horizontal == "center"
         assert alignment.vertical == "top"
         assert alignment.wrap_text is True
-    finally:
-        out_book.close()
 
 
 def test_run_patch_set_alignment_inverse_restore(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"]["A1"].alignment = Alignment(
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet["A1"].alignment = Alignment(
             horizontal="left", vertical="bottom", wrap_text=True
         )
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    _create_workbook(input_path, _seed)
     result = run_patch(
         PatchRequest(
             xlsx_path=input_path,
@@ -1383,7 +1258,7 @@ def test_run_patch_set_alignment_inverse_restore(
             on_conflict="rename",
             return_inverse_ops=True,
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
     assert len(result.inverse_ops) == 1
@@ -1393,30 +1268,24 @@ def test_run_patch_set_alignment_inverse_restore(
             ops=result.inverse_ops,
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
-    restored_book = load_workbook(restored.out_path)
-    try:
+    with closing(load_workbook(restored.out_path)) as restored_book:
         alignment = restored_book["Sheet1"]["A1"].alignment
         assert alignment.horizontal == "left"
         assert alignment.vertical == "bottom"
         assert alignment.wrap_text is True
-    finally:
-        restored_book.close()
 
 
 def test_run_patch_set_style_and_inverse_restore(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
     input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    workbook = load_workbook(input_path)
-    try:
-        workbook["Sheet1"]["A1"].alignment = Alignment(horizontal="left")
-        workbook.save(input_path)
-    finally:
-        workbook.close()
+
+    def _seed(sheet: Worksheet) -> None:
+        sheet["A1"].alignment = Alignment(horizontal="left")
+
+    _create_workbook(input_path, _seed)
 
     result = run_patch(
         PatchRequest(
@@ -1436,13 +1305,12 @@ def test_run_patch_set_style_and_inverse_restore(
             on_conflict="rename",
             return_inverse_ops=True,
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
     assert len(result.inverse_ops) == 1
 
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         cell = out_book["Sheet1"]["A1"]
         assert cell.font.bold is True
         assert str(getattr(cell.font.color, "rgb", "")).upper() == "FF112233"
@@ -1450,8 +1318,6 @@ def test_run_patch_set_style_and_inverse_restore(
         assert str(getattr(cell.fill.start_color, "rgb", "")).upper() == "FFD9E1F2"
         assert cell.alignment.horizontal == "center"
         assert cell.alignment.wrap_text is True
-    finally:
-        out_book.close()
 
     restored = run_patch(
         PatchRequest(
@@ -1459,28 +1325,21 @@ def test_run_patch_set_style_and_inverse_restore(
             ops=result.inverse_ops,
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
-    restored_book = load_workbook(restored.out_path)
-    try:
+    with closing(load_workbook(restored.out_path)) as restored_book:
         restored_cell = restored_book["Sheet1"]["A1"]
         assert restored_cell.font.bold is False
         assert restored_cell.fill.fill_type is None
         assert restored_cell.alignment.horizontal == "left"
-    finally:
-        restored_book.close()
 
 
 def test_run_patch_apply_table_style(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    table_source_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    _seed_table_source(input_path)
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
+            xlsx_path=table_source_workbook,
             ops=[
                 PatchOp(
                     op="apply_table_style",
@@ -1492,31 +1351,24 @@ def test_run_patch_apply_table_style(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is None
-    out_book = load_workbook(result.out_path)
-    try:
+    with closing(load_workbook(result.out_path)) as out_book:
         sheet = out_book["Sheet1"]
         table = sheet.tables["SalesTable"]
         assert table.ref == "A1:B3"
         style_info = table.tableStyleInfo
         assert style_info is not None
         assert style_info.name == "TableStyleMedium2"
-    finally:
-        out_book.close()
 
 
 def test_run_patch_apply_table_style_rejects_duplicate_table_name(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    table_source_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    _seed_table_source(input_path)
     result = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
+            xlsx_path=table_source_workbook,
             ops=[
                 PatchOp(
                     op="apply_table_style",
@@ -1535,22 +1387,18 @@ def test_run_patch_apply_table_style_rejects_duplicate_table_name(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert result.error is not None
     assert "Table name already exists" in result.error.message
 
 
 def test_run_patch_apply_table_style_rejects_intersection(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    table_source_workbook: Path, policy: PathPolicy
 ) -> None:
-    _disable_com(monkeypatch)
-    input_path = tmp_path / "book.xlsx"
-    _create_workbook(input_path)
-    _seed_table_source(input_path)
     first = run_patch(
         PatchRequest(
-            xlsx_path=input_path,
+            xlsx_path=table_source_workbook,
             ops=[
                 PatchOp(
                     op="apply_table_style",
@@ -1562,7 +1410,7 @@ def test_run_patch_apply_table_style_rejects_intersection(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert first.error is None
     second = run_patch(
@@ -1579,14 +1427,14 @@ def test_run_patch_apply_table_style_rejects_intersection(
             ],
             on_conflict="rename",
         ),
-        policy=PathPolicy(root=tmp_path),
+        policy=policy,
     )
     assert second.error is not None
     assert "intersects existing table" in second.error.message
 
 
 def test_run_patch_rejects_alignment_design_op_for_xls(
-    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, policy: PathPolicy
 ) -> None:
     monkeypatch.setattr(
         patch_runner,
@@ -1594,7 +1442,7 @@ def test_run_patch_rejects_alignment_design_op_for_xls(
         lambda: ComAvailability(available=True, reason=None),
     )
     input_path = tmp_path / "book.xls"
-    input_path.write_text("dummy", encoding="utf-8")
+    input_path.touch()
     request = PatchRequest(
         xlsx_path=input_path,
         ops=[
@@ -1610,4 +1458,4 @@ def test_run_patch_rejects_alignment_design_op_for_xls(
     with pytest.raises(
         ValueError, match=r"Design operations are not supported for \.xls files"
     ):
-        run_patch(request, policy=PathPolicy(root=tmp_path))
+        run_patch(request, policy=policy)